@@ -1,3 +1,3 @@
-@echo off
-cd /d "C:\kirchenstream\data"
+@echo off
+cd /d "C:\kirchenstream\data"
 python genHTML.py
\ No newline at end of file
@@ -1,32 +1,50 @@
-import sys
-import os
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from datetime import datetime, timedelta
-from modules.web_parser import extract_events
-from modules.youtube_manager import create_streams
-from modules.xml_writer import StreamInfo, append_stream_to_monthly_xml
-from utils.logger import log
-
-
-def bulk_plan_streams(tage=10):
-    log(f"🚀 Starte Batch-Planung für {tage} Tage ab heute.")
-
-    all_streams = []
-    for offset in range(tage):
-        try:
-            xml_path, events = extract_events(target_day_offset=offset)
-            log(f"📅 Tag +{offset}: {len(events)} relevante Termine gefunden.")
-
-            stream_infos = create_streams(events)
-            for s in stream_infos:
-                si = StreamInfo(s.date, s.time, s.title, s.location, s.stream_url, s.stream_key, s.video_url)
-                append_stream_to_monthly_xml(si)
-
-        except Exception as e:
-            log(f"❌ Fehler an Tag +{offset}: {e}")
-
-    log(f"✅ Batch abgeschlossen. Insgesamt {len(all_streams)} Streams geplant.")
-    return all_streams
-
-if __name__ == "__main__":
-    bulk_plan_streams(tage=10)
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from datetime import datetime, timedelta
+from modules.web_parser import extract_events_range
+from modules.browser_session import close_browser_session
+from modules.youtube_manager import create_streams, retire_streams, stream_exists_in_xml
+from modules.xml_writer import StreamInfo, append_stream_to_monthly_xml
+from utils.logger import log
+
+
+def bulk_plan_streams(tage=10):
+    log(f"🚀 Starte Batch-Planung für {tage} Tage ab heute.")
+
+    all_streams = []
+    try:
+        events_by_day, changes_by_day = extract_events_range(0, tage - 1, return_changes=True)
+    except Exception as e:
+        log(f"❌ Fehler bei der Terminextraktion: {e}")
+        return all_streams
+    finally:
+        close_browser_session()
+
+    # Alle Tage in einem Durchlauf: ein Abruf der anstehenden Broadcasts und gemeinsame Batches statt je Tag
+    to_retire, to_plan = [], []
+    for offset, (day, events) in enumerate(events_by_day.items()):
+        log(f"📅 Tag +{offset} ({day}): {len(events)} relevante Termine gefunden.")
+        to_retire.extend(changes_by_day[day].to_retire())
+        to_plan.extend(changes_by_day[day].to_plan(is_planned=stream_exists_in_xml))
+
+    try:
+        retire_streams(to_retire)
+        stream_infos = create_streams(to_plan)
+    except Exception as e:
+        log(f"❌ Fehler bei der Stream-Anlage: {e}")
+        return all_streams
+
+    for s in stream_infos:
+        try:
+            si = StreamInfo(s.date, s.time, s.title, s.location, s.stream_url, s.stream_key, s.video_url)
+            append_stream_to_monthly_xml(si)
+            all_streams.append(s)
+        except Exception as e:
+            log(f"❌ Fehler beim Eintragen von {s.date} {s.time} {s.title}: {e}")
+
+    log(f"✅ Batch abgeschlossen. Insgesamt {len(all_streams)} Streams geplant.")
+    return all_streams
+
+if __name__ == "__main__":
+    bulk_plan_streams(tage=10)
@@ -1,3 +1,3 @@
-@echo off
-cd /d C:\kirchenstream
+@echo off
+cd /d C:\kirchenstream
 python main.py
\ No newline at end of file
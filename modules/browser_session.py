@@ -0,0 +1,218 @@
+import os
+import time
+import atexit
+import threading
+from contextlib import contextmanager, ExitStack
+import yaml
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+from webdriver_manager.chrome import ChromeDriverManager
+
+from utils.logger import log
+from utils.file_lock import file_lock
+from utils.cookie_handler import handle_cookie_banner, click_accept_button, is_consent_visible, seed_consent_cookies
+
+# === Konfiguration sicher laden relativ zu Skriptpfad ===
+base_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(base_dir, ".."))
+with open(os.path.join(root_dir, "config.yaml"), "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+WEB_CONFIG = config["web"]
+
+# Bereitschafts-Bedingungen für web.wait_mode = explicit
+# Für „keine Treffer“ gibt es kein gesichertes eigenes Markup: leer heißt Listen-Container ohne Einträge,
+# der so EMPTY_SETTLE_MS lang stehen bleibt (falls die Einträge nachgeladen werden).
+LIST_SELECTOR = ".m-churchServiceListItem"
+LIST_CONTAINER_SELECTOR = ".m-churchServiceList"
+EMPTY_SETTLE_MS = 500
+READY_SCRIPT = """
+    if (document.readyState !== 'complete') { return null; }
+    if (document.querySelector(arguments[0])) { return 'Liste'; }
+    if (!document.querySelector(arguments[1])) { window.__emptyListSince = null; return null; }
+    var now = Date.now();
+    if (!window.__emptyListSince) { window.__emptyListSince = now; }
+    return now - window.__emptyListSince >= arguments[2] ? 'keine Treffer' : null;
+"""
+
+class PageNotReadyError(Exception):
+    """Weder Terminliste noch leere Liste bis zur Frist – der Seiteninhalt ist nicht verwertbar."""
+
+def _make_driver(headless=False, profile_dir=None):
+    """
+    Chrome starten – sichtbar oder headless (web.headless). Mit profile_dir nutzt Chrome ein
+    dauerhaftes Profil, in dem die Cookie-Zustimmung über Prozessgrenzen hinweg erhalten bleibt.
+    """
+    options = Options()
+    if profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    else:
+        options.add_argument("--start-maximized")
+    options.add_argument("--disable-gpu")
+    options.add_experimental_option("excludeSwitches", ["enable-logging"])
+
+    # Versuch 1: Selenium-Manager (keine separate Treiber-Installation nötig)
+    try:
+        return webdriver.Chrome(options=options)
+    except Exception as e1:
+        log(f"ℹ️ Selenium-Manager Start fehlgeschlagen, fallback webdriver_manager: {e1}")
+        # Versuch 2: webdriver_manager
+        service = Service(ChromeDriverManager().install())
+        return webdriver.Chrome(service=service, options=options)
+
+class BrowserSession:
+    """
+    Langlebige Chrome-Sitzung: Der Treiber wird beim ersten Seitenaufruf gestartet
+    und für alle weiteren Aufrufe im selben Prozess wiederverwendet (inkl. Cookie-Zustimmung).
+    """
+
+    def __init__(self, headless=False, profile_dir=None, consent_cookies=None):
+        self.headless = headless
+        self.profile_dir = profile_dir
+        self.consent_cookies = consent_cookies or []
+        self.driver = None
+        self.consent_done = False
+        self._lock = threading.Lock()
+        self._profile_claim = None
+
+    def _claim_profile(self):
+        """
+        Ein Chrome-Profil kann nur ein Browser gleichzeitig nutzen. Belegt ein anderer Prozess
+        (Planer, Tageslauf, Benchmark) das dauerhafte Profil, startet diese Sitzung ohne Profil.
+        """
+        if not self.profile_dir:
+            return None
+        claim = ExitStack()
+        try:
+            claim.enter_context(file_lock(self.profile_dir + ".lock", timeout=0))
+        except TimeoutError:
+            log("ℹ️ Chrome-Profil wird von einem anderen Prozess genutzt – starte ohne dauerhaftes Profil.")
+            return None
+        self._profile_claim = claim
+        return self.profile_dir
+
+    def _ensure_driver(self):
+        if self.driver is None:
+            start = time.monotonic()
+            self.driver = _make_driver(self.headless, self._claim_profile())
+            seed_consent_cookies(self.driver, self.consent_cookies)
+            self.consent_done = False
+            log(f"🌐 Browser-Sitzung gestartet ({'headless' if self.headless else 'sichtbar'}) in {time.monotonic() - start:.1f} s.")
+        return self.driver
+
+    def _load(self, url):
+        driver = self._ensure_driver()
+        driver.get(url)
+        if WEB_CONFIG.get("wait_mode", "fixed") == "explicit":
+            self._wait_ready(driver)
+            return driver
+
+        time.sleep(3)
+        if not self.consent_done:
+            if not handle_cookie_banner(driver):   # nur beim ersten Aufruf – das Consent-Cookie bleibt in der Sitzung
+                log("ℹ️ Kein Cookie-Banner gefunden (Zustimmung bereits im Profil gespeichert?).")
+            self.consent_done = True
+        return driver
+
+    def _wait_until(self, driver, condition, timeout, what):
+        """Wartet höchstens timeout Sekunden auf condition und protokolliert die tatsächliche Wartezeit."""
+        start = time.monotonic()
+        try:
+            result = WebDriverWait(driver, timeout, poll_frequency=0.1).until(condition)
+        except TimeoutException:
+            result = None
+        log(f"⏱️ Warten auf {what}: {time.monotonic() - start:.2f} s{'' if result else ' (Zeitlimit erreicht)'}")
+        return result
+
+    def _wait_ready(self, driver):
+        """
+        Statt fester Pausen: auf Cookie-Banner oder Terminliste warten – was zuerst kommt.
+        Ist die Zustimmung schon im Profil bzw. per consent_cookies gesetzt, erscheint kein Banner
+        und die Wartezeit endet mit der Liste.
+        """
+        start = time.monotonic()
+        deadline = start + float(WEB_CONFIG.get("ready_timeout_seconds", 15))
+        fixed_seconds = 3 if self.consent_done else 5
+
+        def list_state(d):
+            return d.execute_script(READY_SCRIPT, LIST_SELECTOR, LIST_CONTAINER_SELECTOR, EMPTY_SETTLE_MS)
+
+        state = None
+        if not self.consent_done:
+            state = self._wait_until(driver, lambda d: "Banner" if click_accept_button(d) else list_state(d),
+                                     max(0.5, deadline - time.monotonic()), "Cookie-Banner oder Terminliste")
+            if state == "Banner":
+                self._wait_until(driver, lambda d: not is_consent_visible(d),
+                                 max(0.5, deadline - time.monotonic()), "Schließen des Cookie-Banners")
+                state = None
+            self.consent_done = True
+
+        if not state:
+            state = self._wait_until(driver, list_state, max(0.5, deadline - time.monotonic()), "Terminliste")
+        if not state:
+            raise PageNotReadyError(f"Terminliste nach {time.monotonic() - start:.2f} s nicht geladen")
+        log(f"⏱️ Seite bereit ({state}) nach {time.monotonic() - start:.2f} s (feste Pausen: {fixed_seconds} s).")
+
+    @contextmanager
+    def page(self, url):
+        """Lädt url und liefert den Treiber; parallele Aufrufer warten, bis die Seite ausgewertet ist."""
+        with self._lock:
+            try:
+                driver = self._load(url)
+            except PageNotReadyError:
+                # Browser läuft, nur die Seite kam nicht – kein Neustart, der Aufrufer wertet den Tag als unvollständig
+                raise
+            except Exception as e:
+                # Treiber abgestürzt oder Fenster geschlossen → einmal neu starten
+                log(f"⚠️ Browser-Sitzung nicht nutzbar, starte neu: {e}")
+                self._quit()
+                driver = self._load(url)
+            yield driver
+
+    def _quit(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                log(f"⚠️ Fehler beim Beenden des Browsers: {e}")
+            self.driver = None
+            self.consent_done = False
+        if self._profile_claim is not None:
+            self._profile_claim.close()
+            self._profile_claim = None
+
+    def close(self):
+        with self._lock:
+            if self.driver is not None:
+                self._quit()
+                log("🔌 Browser-Sitzung geschlossen.")
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_browser_session():
+    """Prozessweite BrowserSession (wird beim Prozessende automatisch geschlossen)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            profile_dir = WEB_CONFIG.get("browser_profile_dir")
+            if profile_dir and not os.path.isabs(profile_dir):
+                profile_dir = os.path.join(root_dir, profile_dir)
+            _session = BrowserSession(
+                headless=WEB_CONFIG.get("headless", False),
+                profile_dir=profile_dir,
+                consent_cookies=WEB_CONFIG.get("consent_cookies")
+            )
+            atexit.register(close_browser_session)
+        return _session
+
+def close_browser_session():
+    with _session_lock:
+        if _session is not None:
+            _session.close()
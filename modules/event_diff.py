@@ -0,0 +1,130 @@
+import os
+import xml.etree.ElementTree as ET
+import yaml
+
+from modules.telegram_sender import send_telegram_message
+from utils.logger import log
+
+# === Konfiguration sicher laden relativ zu Skriptpfad ===
+base_dir = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(base_dir, "..", "config.yaml"), "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+
+class EventChangeSet:
+    """Ergebnis des Abgleichs zweier Extraktionen desselben Tages."""
+
+    def __init__(self, added=None, changed=None, removed=None, unchanged=None):
+        self.added = added or []          # [Event]
+        self.changed = changed or []      # [(altes Event, neues Event)]
+        self.removed = removed or []      # [Event]
+        self.unchanged = unchanged or []  # [Event]
+
+    def is_empty(self):
+        return not (self.added or self.changed or self.removed)
+
+    def to_plan(self, is_planned=None):
+        """
+        Termine, für die Streams angelegt werden müssen: neue und verschobene Termine,
+        dazu unveränderte, die laut is_planned(event) noch keinen Stream haben
+        (z. B. weil die YouTube-Anlage im letzten Lauf fehlgeschlagen ist).
+        """
+        events = self.added + [new for _, new in self.changed]
+        if is_planned is not None:
+            events += [e for e in self.unchanged if not is_planned(e)]
+        return sorted(events, key=lambda e: (e.date, e.time))
+
+    def to_retire(self):
+        """Termine, deren angelegte Streams nicht mehr gelten: entfallene und die alte Zeit verschobener Termine."""
+        events = self.removed + [old for old, _ in self.changed]
+        return sorted(events, key=lambda e: (e.date, e.time))
+
+    def summary(self):
+        return (f"{len(self.added)} neu, {len(self.changed)} geändert, "
+                f"{len(self.removed)} entfallen, {len(self.unchanged)} unverändert")
+
+def _event_from_element(e):
+    from modules.web_parser import Event
+    church_id = e.findtext("church_id")
+    return Event(
+        date=e.findtext("date", ""),
+        time_str=e.findtext("time", ""),
+        title=e.findtext("title", ""),
+        location=e.findtext("location", ""),
+        church_id=int(church_id) if church_id and church_id.isdigit() else church_id
+    )
+
+def read_events_from_xml(path):
+    """Liest eine extrahierte_termine_<datum>.xml wieder ein (leere Liste, wenn nicht vorhanden)."""
+    if not os.path.exists(path):
+        return []
+    try:
+        root = ET.parse(path).getroot()
+    except ET.ParseError as e:
+        log(f"⚠️ Vorherige Extraktion nicht lesbar, wird ignoriert: {path} ({e})")
+        return []
+    return [_event_from_element(e) for e in root.findall("event")]
+
+def diff_events(previous, current):
+    """
+    Vergleicht zwei Terminlisten. Termine gelten als derselbe Termin, wenn Datum, Titel und Ort
+    übereinstimmen; weicht nur die Uhrzeit ab, ist der Termin "geändert" (verschoben).
+    """
+    def group(events):
+        groups = {}
+        for e in events:
+            groups.setdefault((e.date, e.title, e.location), []).append(e)
+        return groups
+
+    old_groups = group(previous)
+    new_groups = group(current)
+    changes = EventChangeSet()
+
+    for key in sorted(set(old_groups) | set(new_groups)):
+        old_list = sorted(old_groups.get(key, []), key=lambda e: e.time)
+        new_list = sorted(new_groups.get(key, []), key=lambda e: e.time)
+
+        # Zuerst exakt gleiche Uhrzeiten zuordnen ...
+        old_times = [e.time for e in old_list]
+        rest_new = []
+        for e in new_list:
+            if e.time in old_times:
+                idx = old_times.index(e.time)
+                old_times.pop(idx)
+                old_list.pop(idx)
+                changes.unchanged.append(e)
+            else:
+                rest_new.append(e)
+
+        # ... dann die übrigen paarweise als Verschiebung werten
+        while old_list and rest_new:
+            changes.changed.append((old_list.pop(0), rest_new.pop(0)))
+        changes.added.extend(rest_new)
+        changes.removed.extend(old_list)
+
+    return changes
+
+def notify_event_changes(changes, day_str):
+    """Protokolliert die Änderungen und meldet verschobene/entfallene Termine an die Sakristei."""
+    log(f"🔍 Terminabgleich {day_str}: {changes.summary()}")
+    for e in changes.added:
+        log(f"➕ Neuer Termin: {e.date} {e.time} - {e.title} ({e.location})")
+    for old, new in changes.changed:
+        log(f"🔀 Termin verschoben: {old.date} {old.time} → {new.time} - {new.title} ({new.location})")
+    for e in changes.removed:
+        log(f"➖ Termin entfallen: {e.date} {e.time} - {e.title} ({e.location})")
+
+    if not (changes.changed or changes.removed):
+        return
+    if not config["telegram"].get("notify_event_changes", True):
+        return
+
+    msg = f"#Sakristei Terminänderung\n📅 {day_str}\n"
+    for old, new in changes.changed:
+        msg += f"🔀 {old.time} → {new.time} Uhr – {new.title}\n"
+    for e in changes.removed:
+        msg += f"❌ entfällt: {e.time} Uhr – {e.title}\n"
+    msg += "ℹ️ Bereits angelegte YouTube-Streams dieser Termine werden gelöscht und nicht mehr gestartet."
+    try:
+        send_telegram_message(msg)
+    except Exception as e:
+        log(f"⚠️ Fehler beim Senden der Terminänderung: {e}")
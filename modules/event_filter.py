@@ -0,0 +1,93 @@
+import re
+from datetime import datetime
+from utils.logger import log
+
+WEEKDAYS = {"mo": 0, "di": 1, "mi": 2, "do": 3, "fr": 4, "sa": 5, "so": 6}
+
+def _compile(patterns):
+    """
+    Fasst alle Muster einer Liste zu EINER Regex zusammen (Groß-/Kleinschreibung egal).
+    Einfache Einträge sind Teilwörter wie bisher, Einträge mit "re:" sind reguläre Ausdrücke.
+    """
+    if not patterns:
+        return None
+    parts = []
+    for p in sorted((str(p) for p in patterns), key=len, reverse=True):
+        parts.append(p[3:] if p.startswith("re:") else re.escape(p))
+    return re.compile("|".join(parts), re.IGNORECASE)
+
+def _weekday(value):
+    if isinstance(value, int):
+        return value
+    return WEEKDAYS[str(value).strip().lower()[:2]]
+
+class FilterRule:
+    def __init__(self, name, include, exclude=None, churches=None, weekdays=None, locations=None):
+        self.name = name
+        self.include = _compile(include)
+        self.exclude = _compile(exclude)
+        self.churches = {str(c) for c in churches} if churches else None
+        self.weekdays = {_weekday(d) for d in weekdays} if weekdays else None
+        self.locations = _compile(locations)
+
+    def matches(self, title, location, church_id, date_str):
+        if self.include is None or not self.include.search(title):
+            return False
+        if self.exclude is not None and self.exclude.search(title):
+            return False
+        if self.churches is not None and str(church_id) not in self.churches:
+            return False
+        if self.locations is not None and not self.locations.search(location or ""):
+            return False
+        if self.weekdays is not None:
+            if not date_str:
+                return False
+            if datetime.strptime(date_str, "%Y-%m-%d").weekday() not in self.weekdays:
+                return False
+        return True
+
+class EventFilter:
+    """
+    Regelwerk für die Terminauswahl, einmalig beim Laden der Konfiguration kompiliert.
+    Ein Termin wird übernommen, wenn er von keinem globalen Ausschluss getroffen wird und
+    mindestens eine Regel passt; match() liefert den Namen der ersten passenden Regel.
+    Sind web.filter_rules gesetzt, gelten nur diese – web.keywords ist die Regel für Konfigurationen ohne Regeln.
+    """
+
+    def __init__(self, rules, exclude=None):
+        self.rules = rules
+        self.exclude = _compile(exclude)
+
+    @classmethod
+    def from_config(cls, web_config):
+        rules = []
+        filter_rules = web_config.get("filter_rules") or []
+        if web_config.get("keywords"):
+            if filter_rules:
+                # Sonst würde die globale Stichwortregel jede Einschränkung nach Kirche/Wochentag/Ort aushebeln
+                log("ℹ️ web.keywords wird ignoriert, da web.filter_rules gesetzt sind.")
+            else:
+                # Bisheriges Verhalten: Titel enthält eines der Stichwörter
+                rules.append(FilterRule("keywords", web_config["keywords"]))
+        for i, rule in enumerate(filter_rules):
+            name = rule.get("name", f"regel_{i + 1}")
+            if not rule.get("include"):
+                log(f"⚠️ Filterregel {name} ohne include wird ignoriert – sie könnte nie greifen.")
+                continue
+            rules.append(FilterRule(
+                name,
+                rule.get("include"),
+                exclude=rule.get("exclude"),
+                churches=rule.get("churches"),
+                weekdays=rule.get("weekdays"),
+                locations=rule.get("locations")
+            ))
+        return cls(rules, exclude=web_config.get("exclude_keywords"))
+
+    def match(self, title, location="", church_id=None, date_str=None):
+        if self.exclude is not None and self.exclude.search(title):
+            return None
+        for rule in self.rules:
+            if rule.matches(title, location, church_id, date_str):
+                return rule.name
+        return None
@@ -0,0 +1,120 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from datetime import datetime, timedelta
+
+from utils.logger import log
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(BASE_DIR, ".."))
+CACHE_DIR = os.path.join(ROOT_DIR, "cache", "gottesdienste")
+
+def content_hash(data):
+    """SHA-256 über Seiteninhalt (bytes) oder bereits geparste Einträge."""
+    if not isinstance(data, bytes):
+        data = json.dumps(data, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+class PageCache:
+    """
+    Festplatten-Cache für abgerufene Gottesdienstseiten und deren geparste Einträge,
+    je Kirche und Zeitraum eine JSON-Datei. Frische Einträge (ttl_minutes) werden ohne
+    Netzwerkzugriff geliefert, danach per ETag/Last-Modified bzw. Inhalts-Hash revalidiert.
+    Zeiträume, die vor heute enden, werden beim Start und danach einmal täglich in put() gelöscht.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, ttl_minutes=60, enabled=True):
+        self.cache_dir = cache_dir
+        self.ttl = timedelta(minutes=ttl_minutes)
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pruned_on = None
+        if enabled:
+            self.prune()
+
+    def _path(self, church_id, start_str, end_str):
+        return os.path.join(self.cache_dir, f"{church_id}_{start_str}_{end_str}.json")
+
+    def get(self, church_id, start_str, end_str):
+        if not self.enabled:
+            return None
+        path = self._path(church_id, start_str, end_str)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            entry["entries"] = [(left, right) for left, right in entry["entries"]]
+            return entry
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log(f"⚠️ Seiten-Cache beschädigt, wird ignoriert: {path} ({e})")
+            return None
+
+    def is_fresh(self, entry):
+        try:
+            fetched_at = datetime.fromisoformat(entry["fetched_at"])
+        except Exception:
+            return False
+        return datetime.now() - fetched_at < self.ttl
+
+    def prune(self):
+        """Cache-Dateien löschen, deren Zeitraum vor heute endete (Dateiname: Kirche_Start_Ende.json)."""
+        today = datetime.now().strftime("%Y-%m-%d")
+        self._pruned_on = today
+        try:
+            names = os.listdir(self.cache_dir)
+        except FileNotFoundError:
+            return
+        removed = 0
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            end_str = name[:-len(".json")].rsplit("_", 1)[-1]
+            if end_str >= today:
+                continue
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+                removed += 1
+            except OSError as e:
+                log(f"⚠️ Veralteter Seiten-Cache nicht löschbar: {name} ({e})")
+        if removed:
+            log(f"🧹 Seiten-Cache: {removed} abgelaufene Zeiträume gelöscht.")
+
+    def put(self, church_id, start_str, end_str, url, entries, page_hash, etag=None, last_modified=None):
+        if not self.enabled:
+            return
+        if self._pruned_on != datetime.now().strftime("%Y-%m-%d"):
+            self.prune()
+        entry = {
+            "url": url,
+            "fetched_at": datetime.now().isoformat(),
+            "content_hash": page_hash,
+            "etag": etag,
+            "last_modified": last_modified,
+            "entries": entries,
+        }
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=self.cache_dir, delete=False) as tmp_file:
+            json.dump(entry, tmp_file, ensure_ascii=False, indent=2)
+            temp_name = tmp_file.name
+        os.replace(temp_name, self._path(church_id, start_str, end_str))
+
+    def touch(self, church_id, start_str, end_str, entry):
+        """Seite unverändert (304 bzw. gleicher Hash) – nur den Zeitstempel erneuern."""
+        self.put(church_id, start_str, end_str, entry.get("url"), entry["entries"],
+                 entry.get("content_hash"), entry.get("etag"), entry.get("last_modified"))
+
+    def record(self, hit, reason):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            log(f"📦 Seiten-Cache {'Treffer' if hit else 'Fehlgriff'} ({reason}) – {self.hits} Treffer / {self.misses} Fehlgriffe")
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses}
@@ -0,0 +1,103 @@
+import os
+import bisect
+import logging
+import threading
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta
+
+from modules.stream_store import XML_DIR, read_month, snapshot_path, journal_path
+from modules.xml_writer import is_dead
+
+def _video_id(stream):
+    return (stream.findtext("video_url") or "").strip().rstrip("/").split("/")[-1]
+
+class StreamIndex:
+    """
+    Im Prozess gehaltener Index der exportierten Monats-XMLs (Snapshot + Journal) für das Dashboard:
+    nach Startzeit sortiert (nächster Stream per bisect) und nach YouTube-Video-ID.
+    Ein Monat wird nur neu eingelesen, wenn sich mtime oder Größe von Snapshot oder Journal geändert
+    haben – bei unveränderten Dateien kostet eine Abfrage nur vier os.stat.
+    """
+
+    def __init__(self, xml_dir=XML_DIR):
+        self.xml_dir = xml_dir
+        self._months = {}      # Monat → (Signatur, [(Startzeit, Video-ID, Element)])
+        self._times = []       # sortierte Startzeiten (nur nicht tote Einträge)
+        self._entries = []     # parallel zu _times
+        self._by_id = {}       # Video-ID → Element (auch tote Einträge)
+        self._lock = threading.Lock()
+
+    def _signature(self, month):
+        """(mtime, Größe) von Snapshot und Journal – None, wenn es beide nicht gibt."""
+        signature = []
+        for path in (snapshot_path(month, self.xml_dir), journal_path(month, self.xml_dir)):
+            try:
+                st = os.stat(path)
+                signature.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature) if any(signature) else None
+
+    def _load_month(self, month):
+        """Liefert True, wenn sich der Monat geändert hat."""
+        signature = self._signature(month)
+        cached = self._months.get(month)
+        if cached is not None and cached[0] == signature:
+            return False
+        if signature is None:
+            self._months[month] = (None, [])
+            return cached is not None
+        try:
+            streams = read_month(month, self.xml_dir)
+        except ET.ParseError as e:
+            logging.warning(f"Monats-XML streams_{month}.xml nicht lesbar, verwende letzten Stand: {e}")
+            return False
+        entries = []
+        for s in streams:
+            try:
+                dt = datetime.strptime(s.findtext("date") + " " + s.findtext("time"), "%Y-%m-%d %H:%M")
+            except (TypeError, ValueError):
+                continue
+            entries.append((dt, _video_id(s), s))
+        self._months[month] = (signature, entries)
+        return True
+
+    def _rebuild(self):
+        entries = [entry for _, month_entries in self._months.values() for entry in month_entries]
+        live = sorted((entry for entry in entries if not is_dead(entry[2])), key=lambda entry: entry[0])
+        self._times = [entry[0] for entry in live]
+        self._entries = live
+        self._by_id = {video_id: s for _, video_id, s in entries if video_id}
+
+    def refresh(self, now=None):
+        """Aktuellen und folgenden Monat prüfen; ältere Monate fallen aus dem Index."""
+        now = now or datetime.now()
+        months = {(now + timedelta(days=offset * 31)).strftime("%Y-%m") for offset in range(2)}
+        with self._lock:
+            changed = False
+            for month in list(self._months):
+                if month not in months:
+                    del self._months[month]
+                    changed = True
+            for month in sorted(months):
+                changed = self._load_month(month) or changed
+            if changed:
+                self._rebuild()
+
+    def next_stream(self, now=None, exclude_ids=()):
+        """Nächster nicht toter Stream nach now, dessen Video-ID nicht in exclude_ids steht (Element oder None)."""
+        now = now or datetime.now()
+        self.refresh(now)
+        with self._lock:
+            for i in range(bisect.bisect_right(self._times, now), len(self._entries)):
+                _, video_id, s = self._entries[i]
+                if video_id not in exclude_ids:
+                    return s
+        return None
+
+    def find(self, video_id, now=None):
+        self.refresh(now)
+        with self._lock:
+            return self._by_id.get(video_id)
+
+stream_index = StreamIndex()
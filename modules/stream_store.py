@@ -0,0 +1,346 @@
+import os
+import glob
+import json
+import sqlite3
+import threading
+import xml.etree.ElementTree as ET
+from datetime import datetime
+import yaml
+
+from modules.stream_info import StreamInfo
+from utils.logger import log
+from utils.file_lock import file_lock, write_atomic
+
+# === Basis & Konfiguration ===
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(BASE_DIR, ".."))
+with open(os.path.join(ROOT_DIR, "config.yaml"), "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+PATHS = config.get("paths", {})
+
+def _abs(path: str) -> str:
+    return path if os.path.isabs(path) else os.path.join(ROOT_DIR, path)
+
+XML_DIR = _abs(PATHS.get("xml_output_dir", "data"))          # Export der Monatsdateien streams_YYYY-MM.xml
+DB_PATH = _abs(PATHS.get("stream_db", os.path.join("data", "streams.db")))
+LOCK_PATH = DB_PATH + ".lock"   # Schreibsperre für Datenbank + XML-Export (Leser sperren nie)
+STORE_CONFIG = config.get("stream_store", {})
+JOURNAL_MAX_BYTES = int(STORE_CONFIG.get("journal_max_kb", 64)) * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS streams (
+    id           INTEGER PRIMARY KEY,
+    date         TEXT NOT NULL,
+    time         TEXT NOT NULL,
+    title        TEXT NOT NULL,
+    location     TEXT,
+    stream_url   TEXT,
+    stream_key   TEXT,
+    video_url    TEXT,
+    broadcast_id TEXT,
+    status       TEXT NOT NULL DEFAULT 'planned',
+    updated_at   TEXT,
+    UNIQUE (date, time, title)
+);
+CREATE INDEX IF NOT EXISTS idx_streams_date ON streams (date);
+CREATE INDEX IF NOT EXISTS idx_streams_broadcast ON streams (broadcast_id);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+_local = threading.local()
+_init_lock = threading.Lock()
+_initialized = set()
+
+def _broadcast_id(video_url):
+    return (video_url or "").strip().rstrip("/").split("/")[-1] or None
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
+
+def _connect():
+    """Eine Verbindung je Thread; WAL erlaubt parallele Leser (Dashboard) neben einem Schreiber (Planung)."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None and getattr(_local, "path", None) == DB_PATH:
+        return conn
+    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    with _init_lock:
+        if DB_PATH not in _initialized:
+            with file_lock(LOCK_PATH, timeout=60):
+                conn.executescript(SCHEMA)
+                _import_xml_once(conn)
+            _initialized.add(DB_PATH)
+    _local.conn, _local.path = conn, DB_PATH
+    return conn
+
+def _import_xml_once(conn):
+    """Übernimmt beim ersten Start alle vorhandenen Monats-XMLs (samt Journal) in die Datenbank."""
+    if conn.execute("SELECT 1 FROM meta WHERE key = 'xml_imported'").fetchone():
+        return
+    imported = 0
+    months = sorted({os.path.basename(path)[8:15] for path in glob.glob(os.path.join(XML_DIR, "streams_*.*"))})
+    for month in months:
+        try:
+            streams = read_month(month)
+        except ET.ParseError as e:
+            log(f"⚠️ Stream-Store: streams_{month}.xml nicht lesbar, übersprungen: {e}")
+            continue
+        for s in streams:
+            record = _record_from_element(s)
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO streams (date, time, title, location, stream_url, stream_key, video_url, "
+                "broadcast_id, status, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (record["date"], record["time"], record["title"], record["location"], record["url"], record["key"],
+                 record["video_url"], _broadcast_id(record["video_url"]), record["status"], _now())
+            )
+            imported += cursor.rowcount
+    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('xml_imported', ?)", (_now(),))
+    conn.commit()
+    if imported:
+        log(f"📥 Stream-Store: {imported} Einträge aus den Monats-XMLs übernommen ({DB_PATH}).")
+
+def _record_from_element(s):
+    return {
+        "date": s.findtext("date"),
+        "time": s.findtext("time"),
+        "title": s.findtext("title"),
+        "location": s.findtext("location"),
+        "url": s.findtext("url"),
+        "key": s.findtext("key"),
+        "video_url": s.findtext("video_url") or "",
+        "status": s.get("status") or "planned",
+    }
+
+def _record(row):
+    """Gleiche Schlüssel wie bisher xml_writer.load_todays_streams_from_xml."""
+    return {
+        "date": row["date"],
+        "time": row["time"],
+        "title": row["title"],
+        "location": row["location"],
+        "url": row["stream_url"],
+        "key": row["stream_key"],
+        "video_url": row["video_url"] or "",
+        "broadcast_id": row["broadcast_id"],
+        "status": row["status"],
+    }
+
+# === Lesen ===
+
+def exists(date_str, time_str, title):
+    """Nicht toter Eintrag mit diesem Termin vorhanden? (Index über UNIQUE(date, time, title))"""
+    row = _connect().execute(
+        "SELECT 1 FROM streams WHERE date = ? AND time = ? AND title = ? AND status != 'dead'",
+        (date_str, time_str, title)
+    ).fetchone()
+    return row is not None
+
+def find(date_str, time_str, title):
+    """Nicht toter Eintrag dieses Termins oder None."""
+    row = _connect().execute(
+        "SELECT * FROM streams WHERE date = ? AND time = ? AND title = ? AND status != 'dead'",
+        (date_str, time_str, title)
+    ).fetchone()
+    return _record(row) if row else None
+
+def streams_on(date_str, include_dead=False):
+    return streams_between(date_str, date_str, include_dead)
+
+def streams_between(start_date, end_date, include_dead=False):
+    """Einträge von start_date bis einschließlich end_date (YYYY-MM-DD), nach Datum/Uhrzeit sortiert."""
+    query = "SELECT * FROM streams WHERE date BETWEEN ? AND ?"
+    if not include_dead:
+        query += " AND status != 'dead'"
+    rows = _connect().execute(query + " ORDER BY date, time", (start_date, end_date)).fetchall()
+    return [_record(row) for row in rows]
+
+def streams_in_month(month, include_dead=False):
+    return streams_between(f"{month}-01", f"{month}-31", include_dead)
+
+def find_by_broadcast(broadcast_id):
+    row = _connect().execute("SELECT * FROM streams WHERE broadcast_id = ?", (broadcast_id,)).fetchone()
+    return _record(row) if row else None
+
+# === Schreiben ===
+
+def add_stream(stream_info):
+    """
+    Speichert einen angelegten Stream. Ein als tot markierter Eintrag desselben Termins wird ersetzt,
+    ein lebender bleibt (Duplikat). Liefert True, wenn gespeichert wurde.
+    """
+    conn = _connect()
+    with file_lock(LOCK_PATH, timeout=60):
+        with conn:
+            existing = conn.execute(
+                "SELECT status FROM streams WHERE date = ? AND time = ? AND title = ?",
+                (stream_info.date, stream_info.time, stream_info.title)
+            ).fetchone()
+            if existing is not None and existing["status"] != "dead":
+                log(f"⚠️ Stream-Store: Duplikat bereits vorhanden – {stream_info.date} {stream_info.time} {stream_info.title}")
+                return False
+            conn.execute(
+                "INSERT INTO streams (date, time, title, location, stream_url, stream_key, video_url, broadcast_id, "
+                "status, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'planned', ?) "
+                "ON CONFLICT (date, time, title) DO UPDATE SET location = excluded.location, "
+                "stream_url = excluded.stream_url, stream_key = excluded.stream_key, video_url = excluded.video_url, "
+                "broadcast_id = excluded.broadcast_id, status = 'planned', updated_at = excluded.updated_at",
+                (stream_info.date, stream_info.time, stream_info.title, stream_info.location, stream_info.stream_url,
+                 stream_info.stream_key, stream_info.video_url, _broadcast_id(stream_info.video_url), _now())
+            )
+        _append_journal("add", {
+            "date": stream_info.date, "time": stream_info.time, "title": stream_info.title,
+            "location": stream_info.location, "url": stream_info.stream_url, "key": stream_info.stream_key,
+            "video_url": stream_info.video_url,
+        })
+    if existing is not None:
+        log(f"♻️ Stream-Store: toter Eintrag ersetzt – {stream_info.date} {stream_info.time} {stream_info.title}")
+    log(f"📦 Stream gespeichert: {stream_info.date} {stream_info.time} {stream_info.title}")
+    return True
+
+def _update_by_broadcast(broadcast_id, op, assignments, values, fields):
+    conn = _connect()
+    with file_lock(LOCK_PATH, timeout=60):
+        with conn:
+            row = conn.execute("SELECT date, time, title FROM streams WHERE broadcast_id = ?",
+                               (broadcast_id,)).fetchone()
+            if row is None:
+                return False
+            conn.execute(f"UPDATE streams SET {assignments}, updated_at = ? WHERE broadcast_id = ?",
+                         (*values, _now(), broadcast_id))
+        _append_journal(op, dict(fields, date=row["date"], time=row["time"], title=row["title"]))
+    return True
+
+def mark_dead(broadcast_id):
+    """Broadcast existiert auf YouTube nicht mehr – Eintrag bleibt sichtbar, wird aber nicht mehr gestreamt."""
+    return _update_by_broadcast(broadcast_id, "dead", "status = 'dead'", (), {})
+
+def update_stream_target(broadcast_id, stream_url, stream_key):
+    return _update_by_broadcast(broadcast_id, "update", "stream_url = ?, stream_key = ?", (stream_url, stream_key),
+                                {"url": stream_url, "key": stream_key})
+
+# === XML-Export: Monats-Snapshot + Journal ===
+#
+# Jede Änderung wird als eine JSON-Zeile an streams_YYYY-MM.journal.jsonl angehängt (O(1), fsync), statt die
+# ganze Monats-XML neu zu schreiben. Die Kompaktierung schreibt den Snapshot streams_YYYY-MM.xml aus der
+# Datenbank neu und leert das Journal – ab JOURNAL_MAX_BYTES, bei der ersten Änderung eines neuen Tages,
+# vor dem Telegram-Versand und am Ende des Tageslaufs (compact_all). Leser nutzen read_month.
+
+def journal_path(month, xml_dir=None):
+    return os.path.join(xml_dir or XML_DIR, f"streams_{month}.journal.jsonl")
+
+def snapshot_path(month, xml_dir=None):
+    return os.path.join(xml_dir or XML_DIR, f"streams_{month}.xml")
+
+def _journal_started_before_today(path):
+    with open(path, "r", encoding="utf-8") as f:
+        first = f.readline()
+    try:
+        return json.loads(first)["ts"][:10] < datetime.now().strftime("%Y-%m-%d")
+    except (ValueError, KeyError, TypeError):
+        return True
+
+def _append_journal(op, fields):
+    # Nur unter LOCK_PATH aufrufen
+    month = fields["date"][:7]
+    path = journal_path(month)
+    line = json.dumps(dict(fields, op=op, ts=_now()), ensure_ascii=False).encode("utf-8") + b"\n"
+    os.makedirs(XML_DIR, exist_ok=True)
+    with open(path, "a+b") as f:
+        if f.tell():
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                line = b"\n" + line   # abgebrochene letzte Zeile nach Absturz abschließen
+        f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+    if os.path.getsize(path) >= JOURNAL_MAX_BYTES or _journal_started_before_today(path):
+        _compact(month)
+
+def _apply_journal(streams, path):
+    """Wendet die Journalzeilen auf die Snapshot-Elemente an (Schlüssel: Datum, Uhrzeit, Titel)."""
+    by_key = {(s.findtext("date"), s.findtext("time"), s.findtext("title")): s for s in streams}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return streams
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue   # nach Absturz halb geschriebene Zeile
+        key = (entry["date"], entry["time"], entry["title"])
+        if entry["op"] == "add":
+            e = StreamInfo(entry["date"], entry["time"], entry["title"], entry["location"],
+                           entry["url"], entry["key"], entry["video_url"]).to_xml_element()
+            if key in by_key:
+                streams[streams.index(by_key[key])] = e
+            else:
+                streams.append(e)
+            by_key[key] = e
+        elif key in by_key:
+            s = by_key[key]
+            if entry["op"] == "dead":
+                s.set("status", "dead")
+            elif entry["op"] == "update":
+                s.find("url").text = entry["url"]
+                s.find("key").text = entry["key"]
+    return streams
+
+def read_month(month, xml_dir=None):
+    """
+    Alle <stream>-Elemente eines Monats (auch tote) aus Snapshot und Journal, nach Datum/Uhrzeit sortiert.
+    Ohne Sperre: der Snapshot wird atomar ersetzt, Journalzeilen sind idempotent.
+    """
+    try:
+        streams = ET.parse(snapshot_path(month, xml_dir)).getroot().findall("stream")
+    except FileNotFoundError:
+        streams = []
+    streams = _apply_journal(list(streams), journal_path(month, xml_dir))
+    streams.sort(key=lambda s: (s.findtext("date") or "", s.findtext("time") or ""))
+    return streams
+
+def _export_month(month):
+    # Nur unter LOCK_PATH aufrufen: die Datenbank wird innerhalb der Sperre gelesen, damit der zuletzt
+    # schreibende Prozess immer den neuesten Stand exportiert; temporäre Datei + os.replace, damit
+    # Leser (Dashboard, Telegram-Versand) nie eine halb geschriebene Datei sehen.
+    root = ET.Element("streams")
+    for record in streams_in_month(month, include_dead=True):
+        e = StreamInfo(record["date"], record["time"], record["title"], record["location"],
+                       record["url"], record["key"], record["video_url"]).to_xml_element()
+        if record["status"] == "dead":
+            e.set("status", "dead")
+        root.append(e)
+    path = snapshot_path(month)
+    write_atomic(path, ET.tostring(root, encoding="utf-8", xml_declaration=True))
+    return path
+
+def _compact(month):
+    path = _export_month(month)
+    try:
+        os.remove(journal_path(month))
+    except FileNotFoundError:
+        pass
+    except PermissionError as e:
+        # Windows: ein Leser hat das Journal gerade offen – Einträge stecken schon im Snapshot, nächster Versuch später
+        log(f"⚠️ Stream-Store: Journal {month} nicht geleert: {e}")
+    return path
+
+def compact_month(month):
+    """Faltet das Journal in streams_YYYY-MM.xml (z. B. vor dem Telegram-Versand) und liefert den Dateipfad."""
+    _connect()   # Schema/Erstimport nehmen selbst LOCK_PATH – vor der Sperre, file_lock ist nicht reentrant
+    with file_lock(LOCK_PATH, timeout=60):
+        return _compact(month)
+
+def compact_all():
+    """Kompaktiert alle Monate mit offenem Journal (Tagesende)."""
+    months = sorted(os.path.basename(path)[8:15]
+                    for path in glob.glob(os.path.join(XML_DIR, "streams_*.journal.jsonl")))
+    for month in months:
+        compact_month(month)
+    if months:
+        log(f"🗜️ Stream-Store: Journal für {', '.join(months)} in die Monats-XML übernommen.")
+    return months
@@ -1,142 +1,415 @@
-import os
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
-from datetime import datetime, timedelta
-import time
-import yaml
-import xml.etree.ElementTree as ET
-
-from utils.logger import log
-from utils.cookie_handler import handle_cookie_banner
-
-# === Konfiguration sicher laden relativ zu Skriptpfad ===
-base_dir = os.path.dirname(os.path.abspath(__file__))
-root_dir = os.path.abspath(os.path.join(base_dir, ".."))
-with open(os.path.join(root_dir, "config.yaml"), "r", encoding="utf-8") as f:
-    config = yaml.safe_load(f)
-WEB_CONFIG = config["web"]
-
-class Event:
-    def __init__(self, date, time_str, title, location):
-        self.date = date
-        self.time = time_str
-        self.title = title
-        self.location = location
-
-    def to_xml_element(self):
-        e = ET.Element("event")
-        ET.SubElement(e, "date").text = self.date
-        ET.SubElement(e, "time").text = self.time
-        ET.SubElement(e, "title").text = self.title
-        ET.SubElement(e, "location").text = self.location
-        return e
-
-def _make_visible_driver():
-    """Chrome mit GUI starten (kein Headless), Fenster bleibt offen."""
-    options = Options()
-    # WICHTIG: Sichtbar machen
-    # KEIN --headless
-    options.add_argument("--disable-gpu")
-    options.add_argument("--start-maximized")
-    # Fenster nach Scriptende nicht sofort schließen (praktisch zum Debuggen)
-    options.add_experimental_option("detach", True)
-    options.add_experimental_option("excludeSwitches", ["enable-logging"])
-
-    # Versuch 1: Selenium-Manager (keine separate Treiber-Installation nötig)
-    try:
-        return webdriver.Chrome(options=options)
-    except Exception as e1:
-        log(f"ℹ️ Selenium-Manager Start fehlgeschlagen, fallback webdriver_manager: {e1}")
-        # Versuch 2: webdriver_manager
-        service = Service(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=options)
-
-def extract_events(target_day_offset=None, output_dir="extrahierte_termine"):
-    if target_day_offset is None:
-        target_day_offset = WEB_CONFIG["target_offset_days"]
-
-    ziel_datum = datetime.today() + timedelta(days=target_day_offset)
-    ziel_str = ziel_datum.strftime("%Y-%m-%d")
-    url = (
-        "https://pfarrverband-waldkirchen.bistum-passau.de/aktuelles-termine/gottesdienste"
-        f"?startDate={ziel_str}&endDate={ziel_str}&church={WEB_CONFIG['church_id']}"
-    )
-
-    log(f"Zieltags-Datum: {ziel_str}")
-    log(f"URL aufgerufen: {url}")
-
-    # Sichtbarer Chrome
-    driver = _make_visible_driver()
-    events = []
-
-    try:
-        driver.get(url)
-        time.sleep(3)
-        handle_cookie_banner(driver)   # hier interagierst Du sichtbar mit dem Banner
-        time.sleep(2)
-
-        entries = driver.find_elements(By.CLASS_NAME, "m-churchServiceListItem")
-        log(f"{len(entries)} Gottesdienst-Einträge gefunden.")
-
-        for entry in entries:
-            try:
-                left = entry.find_element(By.CLASS_NAME, "m-churchServiceListItem__left")
-                right = entry.find_element(By.CLASS_NAME, "m-churchServiceListItem__right")
-
-                left_text = " ".join(left.text.strip().splitlines())
-                right_lines = right.text.strip().split("\n")
-
-                title = right_lines[0].strip() if len(right_lines) > 0 else ""
-                church = right_lines[1].strip() if len(right_lines) > 1 else ""
-
-                if any(keyword in title.lower() for keyword in WEB_CONFIG["keywords"]):
-                    parts = left_text.split(", ")
-                    datum_roh = parts[0].split()[0]
-                    uhrzeit = parts[1].split(" Uhr")[0].strip()
-
-                    tag, monat = datum_roh.split(".")
-                    datum_final = f"{ziel_datum.year}-{monat.zfill(2)}-{tag.zfill(2)}"
-
-                    events.append(Event(
-                        date=datum_final,
-                        time_str=uhrzeit,
-                        title=title,
-                        location=church
-                    ))
-
-                    log(f"✅ Termin übernommen: {datum_final} {uhrzeit} - {title} ({church})")
-                else:
-                    log(f"ℹ️ Termin ignoriert: {title}")
-            except Exception as e:
-                log(f"⚠️ Fehler beim Parsen eines Eintrags: {e}")
-
-    except Exception as e:
-        log(f"❌ Fehler beim Seitenaufruf oder Cookie-Handling: {e}")
-    finally:
-        # NICHT quit() aufrufen, damit das Fenster sichtbar bleibt, solange Du willst.
-        # Zum produktiven Betrieb ohne GUI wieder driver.quit() aktivieren.
-        pass
-        driver.quit()
-
-    # Ausgabeordner WD-unabhängig relativ zum Projekt
-    out_dir_abs = output_dir if os.path.isabs(output_dir) else os.path.join(root_dir, output_dir)
-    os.makedirs(out_dir_abs, exist_ok=True)
-    xml_filename = os.path.join(out_dir_abs, f"extrahierte_termine_{ziel_str}.xml")
-    write_events_to_xml(events, xml_filename)
-    return xml_filename, events
-
-def write_events_to_xml(events, path):
-    root = ET.Element("events")
-    for event in events:
-        root.append(event.to_xml_element())
-    tree = ET.ElementTree(root)
-    tree.write(path, encoding="utf-8", xml_declaration=True)
-    log(f"✅ XML-Datei gespeichert unter '{path}'")
-
-if __name__ == "__main__":
-    filename, extracted = extract_events()
-    print(f"✅ XML-Datei geschrieben: {filename}")
-    print(f"{len(extracted)} relevante Termine extrahiert.")
+import os
+import re
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup, Comment, NavigableString
+from selenium.webdriver.common.by import By
+from datetime import datetime, timedelta
+import yaml
+import xml.etree.ElementTree as ET
+
+from utils.logger import log
+from modules.browser_session import get_browser_session, PageNotReadyError
+from modules.page_cache import PageCache, content_hash
+from modules.event_filter import EventFilter
+from modules.event_diff import EventChangeSet, read_events_from_xml, diff_events, notify_event_changes
+
+# === Konfiguration sicher laden relativ zu Skriptpfad ===
+base_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(base_dir, ".."))
+with open(os.path.join(root_dir, "config.yaml"), "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+WEB_CONFIG = config["web"]
+
+BASE_URL = "https://pfarrverband-waldkirchen.bistum-passau.de/aktuelles-termine/gottesdienste"
+ENTRY_CLASS = "m-churchServiceListItem"
+LIST_MARKER = "m-churchServiceList"
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept-Language": "de-DE,de;q=0.9",
+}
+EVENT_FILTER = EventFilter.from_config(WEB_CONFIG)
+PAGE_CACHE = PageCache(
+    ttl_minutes=WEB_CONFIG.get("cache_ttl_minutes", 60),
+    enabled=WEB_CONFIG.get("cache_enabled", True)
+)
+DATE_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.?(?:\d{4}|\d{2}(?!\d|[:.]\d))?")
+TIME_RE = re.compile(r"(\d{1,2})[:.](\d{2})|(\d{1,2})\s*Uhr")
+# Tags, die im Browser einen Zeilenumbruch erzeugen (nachgebildet für element.text)
+BLOCK_TAGS = {"div", "p", "br", "li", "ul", "ol", "section", "article", "header", "footer",
+              "h1", "h2", "h3", "h4", "h5", "h6", "table", "tr"}
+
+class Event:
+    def __init__(self, date, time_str, title, location, church_id=None, rule=None):
+        self.date = date
+        self.time = time_str
+        self.title = title
+        self.location = location
+        self.church_id = church_id
+        self.rule = rule  # Name der Filterregel, die den Termin übernommen hat
+
+    def key(self):
+        return (self.date, self.time, self.title, self.location)
+
+    def to_xml_element(self):
+        e = ET.Element("event")
+        ET.SubElement(e, "date").text = self.date
+        ET.SubElement(e, "time").text = self.time
+        ET.SubElement(e, "title").text = self.title
+        ET.SubElement(e, "location").text = self.location
+        if self.church_id is not None:
+            ET.SubElement(e, "church_id").text = str(self.church_id)
+        return e
+
+def _church_ids():
+    """web.church_id darf eine einzelne ID oder eine Liste von IDs sein."""
+    ids = WEB_CONFIG["church_id"]
+    return list(ids) if isinstance(ids, (list, tuple)) else [ids]
+
+def _build_url(start_str, end_str, church_id=None):
+    if church_id is None:
+        church_id = WEB_CONFIG["church_id"]
+    return f"{BASE_URL}?startDate={start_str}&endDate={end_str}&church={church_id}"
+
+def _collect_text(node, parts):
+    for child in node.children:
+        if isinstance(child, Comment):
+            continue
+        if isinstance(child, NavigableString):
+            parts.append(str(child))
+        elif child.name in ("script", "style"):
+            continue
+        else:
+            block = child.name in BLOCK_TAGS
+            if block:
+                parts.append("\n")
+            _collect_text(child, parts)
+            if block:
+                parts.append("\n")
+
+def _rendered_lines(element):
+    """Textzeilen eines Elements so, wie Selenium sie über element.text liefern würde."""
+    parts = []
+    _collect_text(element, parts)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return [line for line in lines if line]
+
+def parse_entries_html(html):
+    """
+    Zerlegt das HTML der Gottesdienstseite in (left_text, right_lines)-Paare.
+    Gibt None zurück, wenn das Listen-Markup fehlt (z. B. weil die Seite per JavaScript rendert).
+    Maßgeblich ist ein Element mit der Listenklasse – der Klassenname allein kann auch in CSS/JS stehen.
+    """
+    if LIST_MARKER not in html:
+        return None
+
+    soup = BeautifulSoup(html, "html.parser")
+    if soup.find(class_=LIST_MARKER) is None:
+        return None
+    entries = []
+    for item in soup.find_all(class_=ENTRY_CLASS):
+        left = item.find(class_=f"{ENTRY_CLASS}__left")
+        right = item.find(class_=f"{ENTRY_CLASS}__right")
+        if left is None or right is None:
+            log("⚠️ Fehler beim Parsen eines Eintrags: linke oder rechte Spalte fehlt")
+            continue
+        entries.append((" ".join(_rendered_lines(left)), _rendered_lines(right)))
+    return entries
+
+def _fetch_entries_http(url, cache_key, cached):
+    headers = dict(HTTP_HEADERS)
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        response = requests.get(url, headers=headers, timeout=WEB_CONFIG.get("http_timeout_seconds", 20))
+        if response.status_code == 304 and cached:
+            PAGE_CACHE.touch(*cache_key, cached)
+            PAGE_CACHE.record(True, "HTTP 304")
+            return cached["entries"]
+        response.raise_for_status()
+    except Exception as e:
+        log(f"⚠️ HTTP-Abruf fehlgeschlagen: {e}")
+        return None
+
+    page_hash = content_hash(response.content)
+    if cached and cached.get("content_hash") == page_hash:
+        PAGE_CACHE.touch(*cache_key, cached)
+        PAGE_CACHE.record(True, "Inhalt unverändert")
+        return cached["entries"]
+
+    entries = parse_entries_html(response.text)
+    if entries is not None:
+        PAGE_CACHE.record(False, "Seite neu geparst")
+        PAGE_CACHE.put(*cache_key, url, entries, page_hash,
+                       response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    return entries
+
+def _fetch_entries_selenium(url):
+    """Roh-Einträge über die Browser-Sitzung; None, wenn die Seite nicht geladen werden konnte."""
+    entries = []
+
+    try:
+        with get_browser_session().page(url) as driver:
+            for entry in driver.find_elements(By.CLASS_NAME, ENTRY_CLASS):
+                try:
+                    left = entry.find_element(By.CLASS_NAME, f"{ENTRY_CLASS}__left")
+                    right = entry.find_element(By.CLASS_NAME, f"{ENTRY_CLASS}__right")
+                    entries.append((" ".join(left.text.strip().splitlines()), right.text.strip().split("\n")))
+                except Exception as e:
+                    log(f"⚠️ Fehler beim Parsen eines Eintrags: {e}")
+            if not entries and not driver.find_elements(By.CLASS_NAME, LIST_MARKER):
+                # Auch bei festen Pausen: ohne Listen-Container ist das kein leerer Tag
+                raise PageNotReadyError("Listen-Container fehlt")
+
+    except PageNotReadyError as e:
+        log(f"❌ Gottesdienstseite nicht bereit: {e}")
+        return None
+    except Exception as e:
+        log(f"❌ Fehler beim Seitenaufruf oder Cookie-Handling: {e}")
+        return None
+
+    return entries
+
+def _fetch_entries(start_str, end_str, church_id=None):
+    """
+    Holt die Roh-Einträge für Kirche und Zeitraum – aus dem Seiten-Cache, per HTTP
+    oder über Selenium (je nach web.engine, HTTP fällt bei fehlendem Markup auf Selenium zurück).
+    None, wenn die Seite nicht geladen werden konnte – im Unterschied zu [] für einen Tag ohne Termine.
+    """
+    if church_id is None:
+        church_id = WEB_CONFIG["church_id"]
+    url = _build_url(start_str, end_str, church_id)
+    log(f"URL aufgerufen: {url}")
+
+    cache_key = (church_id, start_str, end_str)
+    cached = PAGE_CACHE.get(*cache_key)
+    if cached and PAGE_CACHE.is_fresh(cached):
+        PAGE_CACHE.record(True, "TTL")
+        return cached["entries"]
+
+    engine = WEB_CONFIG.get("engine", "selenium")
+    if engine == "http":
+        entries = _fetch_entries_http(url, cache_key, cached)
+        if entries is not None:
+            log(f"🌐 HTTP-Extraktion: {len(entries)} Gottesdienst-Einträge gefunden.")
+            return entries
+        log("ℹ️ Kein Gottesdienst-Markup per HTTP gefunden – Fallback auf Selenium.")
+
+    entries = _fetch_entries_selenium(url)
+    if entries is None:
+        log(f"❌ Gottesdienstseite nicht abrufbar (Kirche {church_id}, {start_str} bis {end_str}).")
+        return None
+    log(f"{len(entries)} Gottesdienst-Einträge gefunden.")
+
+    entries_hash = content_hash(entries)
+    if cached and cached.get("content_hash") == entries_hash:
+        # Die Seite wurde trotzdem vollständig gerendert – kein Treffer, nur der Zeitstempel wird erneuert
+        PAGE_CACHE.touch(*cache_key, cached)
+        PAGE_CACHE.record(False, "Inhalt unverändert")
+    else:
+        PAGE_CACHE.record(False, "Seite neu geladen")
+        PAGE_CACHE.put(*cache_key, url, entries, entries_hash)
+    return entries
+
+def parse_left_column(left_text):
+    """
+    Liefert (tag, monat, "HH:MM") aus der linken Spalte, z. B. "29.05. Do, 10:00 Uhr".
+    Toleriert auch "9 Uhr", "18.30 Uhr", "8:15" und Zeitspannen wie "10:00 - 11:00 Uhr".
+    """
+    date_match = DATE_RE.search(left_text)
+    if not date_match:
+        raise ValueError(f"Kein Datum in '{left_text}'")
+    time_match = TIME_RE.search(left_text, date_match.end())
+    if not time_match:
+        raise ValueError(f"Keine Uhrzeit in '{left_text}'")
+
+    if time_match.group(1) is not None:
+        stunde, minute = int(time_match.group(1)), int(time_match.group(2))
+    else:
+        stunde, minute = int(time_match.group(3)), 0
+    if stunde > 23 or minute > 59:
+        raise ValueError(f"Ungültige Uhrzeit in '{left_text}'")
+    return date_match.group(1), date_match.group(2), f"{stunde:02d}:{minute:02d}"
+
+def _resolve_date(tag, monat, start_datum, end_datum):
+    """Ergänzt das Jahr zu Tag/Monat so, dass das Datum im abgefragten Zeitraum liegt (Jahreswechsel!)."""
+    for jahr in range(start_datum.year, end_datum.year + 1):
+        try:
+            kandidat = datetime(jahr, int(monat), int(tag)).date()
+        except ValueError:
+            continue
+        if start_datum.date() <= kandidat <= end_datum.date():
+            return kandidat.strftime("%Y-%m-%d")
+    return f"{start_datum.year}-{monat.zfill(2)}-{tag.zfill(2)}"
+
+def _events_from_entries(entries, start_datum, end_datum=None, church_id=None):
+    if end_datum is None:
+        end_datum = start_datum
+
+    events = []
+    for left_text, right_lines in entries:
+        try:
+            title = right_lines[0].strip() if len(right_lines) > 0 else ""
+            church = right_lines[1].strip() if len(right_lines) > 1 else ""
+
+            try:
+                tag, monat, uhrzeit = parse_left_column(left_text)
+                datum_final = _resolve_date(tag, monat, start_datum, end_datum)
+                parse_error = None
+            except Exception as e:
+                datum_final, uhrzeit, parse_error = None, None, e
+
+            rule = EVENT_FILTER.match(title, church, church_id, datum_final)
+            if rule is None:
+                log(f"ℹ️ Termin ignoriert: {title}")
+                continue
+            if parse_error is not None:
+                raise parse_error
+
+            events.append(Event(
+                date=datum_final,
+                time_str=uhrzeit,
+                title=title,
+                location=church,
+                church_id=church_id,
+                rule=rule
+            ))
+
+            log(f"✅ Termin übernommen: {datum_final} {uhrzeit} - {title} ({church}) [Regel: {rule}]")
+        except Exception as e:
+            log(f"⚠️ Fehler beim Parsen eines Eintrags: {e}")
+    return events
+
+def _extract_window(start_datum, end_datum):
+    """
+    Termine aller Kirchen aus web.church_id im Zeitraum. Mehrere Kirchen werden parallel
+    (max. web.max_workers gleichzeitig) abgerufen und nach (Datum, Uhrzeit, Titel, Ort) zusammengeführt.
+    Liefert (events, complete); complete ist False, wenn mindestens eine Kirche nicht abrufbar war.
+    """
+    start_str = start_datum.strftime("%Y-%m-%d")
+    end_str = end_datum.strftime("%Y-%m-%d")
+    church_ids = _church_ids()
+
+    def fetch(church_id):
+        entries = _fetch_entries(start_str, end_str, church_id)
+        if entries is None:
+            return None
+        return _events_from_entries(entries, start_datum, end_datum, church_id)
+
+    if len(church_ids) == 1:
+        results = [fetch(church_ids[0])]
+    else:
+        workers = max(1, min(int(WEB_CONFIG.get("max_workers", 4)), len(church_ids)))
+        log(f"⛪ Rufe {len(church_ids)} Kirchen parallel ab ({workers} Worker).")
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(fetch, church_ids))
+
+    merged = {}
+    for events in results:
+        for event in events or []:
+            if event.key() in merged:
+                log(f"ℹ️ Doppelter Termin zusammengeführt: {event.date} {event.time} - {event.title} ({event.location})")
+                continue
+            merged[event.key()] = event
+    complete = all(events is not None for events in results)
+    return sorted(merged.values(), key=lambda e: (e.date, e.time)), complete
+
+def extract_events(target_day_offset=None, output_dir="extrahierte_termine", return_changes=False):
+    """
+    Extrahiert die Termine für Tag +target_day_offset und schreibt extrahierte_termine_<datum>.xml.
+    Mit return_changes=True wird zusätzlich das EventChangeSet gegenüber der vorherigen
+    Extraktion dieses Tages zurückgegeben: (xml_filename, events, changes).
+    """
+    if target_day_offset is None:
+        target_day_offset = WEB_CONFIG["target_offset_days"]
+
+    ziel_datum = datetime.today() + timedelta(days=target_day_offset)
+    ziel_str = ziel_datum.strftime("%Y-%m-%d")
+    log(f"Zieltags-Datum: {ziel_str}")
+
+    events, complete = _extract_window(ziel_datum, ziel_datum)
+
+    xml_filename, changes = _write_day_xml(events, ziel_str, output_dir, complete)
+    if return_changes:
+        return xml_filename, events, changes
+    return xml_filename, events
+
+def extract_events_range(start_offset, end_offset, output_dir="extrahierte_termine", return_changes=False):
+    """
+    Extrahiert alle Termine von Tag +start_offset bis einschließlich Tag +end_offset
+    mit einem Seitenaufruf je web.range_chunk_days Tage statt einem Aufruf pro Tag.
+    Gibt ein nach Datum sortiertes Dict {"YYYY-MM-DD": [Event, ...]} zurück (auch leere Tage)
+    und schreibt wie extract_events je Tag eine extrahierte_termine_<datum>.xml.
+    Mit return_changes=True zusätzlich {"YYYY-MM-DD": EventChangeSet}.
+    """
+    heute = datetime.today()
+    start_datum = heute + timedelta(days=start_offset)
+    end_datum = heute + timedelta(days=end_offset)
+    chunk_days = max(1, int(WEB_CONFIG.get("range_chunk_days", 14)))
+
+    log(f"Zeitraum: {start_datum.strftime('%Y-%m-%d')} bis {end_datum.strftime('%Y-%m-%d')}")
+
+    events_by_day = {}
+    incomplete_days = set()
+    for offset in range(start_offset, end_offset + 1):
+        events_by_day[(heute + timedelta(days=offset)).strftime("%Y-%m-%d")] = []
+
+    chunk_start = start_datum
+    while chunk_start.date() <= end_datum.date():
+        chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end_datum)
+        events, complete = _extract_window(chunk_start, chunk_end)
+        if not complete:
+            day = chunk_start
+            while day.date() <= chunk_end.date():
+                incomplete_days.add(day.strftime("%Y-%m-%d"))
+                day += timedelta(days=1)
+        for event in events:
+            if event.date in events_by_day:
+                events_by_day[event.date].append(event)
+            else:
+                log(f"⚠️ Termin außerhalb des Zeitraums ignoriert: {event.date} {event.time} - {event.title}")
+
+        chunk_start = chunk_end + timedelta(days=1)
+
+    changes_by_day = {}
+    for day, events in events_by_day.items():
+        _, changes_by_day[day] = _write_day_xml(events, day, output_dir, day not in incomplete_days)
+    if return_changes:
+        return events_by_day, changes_by_day
+    return events_by_day
+
+def _write_day_xml(events, day_str, output_dir, complete=True):
+    # Ausgabeordner WD-unabhängig relativ zum Projekt
+    out_dir_abs = output_dir if os.path.isabs(output_dir) else os.path.join(root_dir, output_dir)
+    os.makedirs(out_dir_abs, exist_ok=True)
+    xml_filename = os.path.join(out_dir_abs, f"extrahierte_termine_{day_str}.xml")
+
+    if not complete:
+        # Abruf fehlgeschlagen: kein Abgleich (sonst gälten alle Termine als entfallen), keine Benachrichtigung,
+        # letzte Extraktion bleibt stehen. Erfolgreich gelesene Termine werden wie unveränderte eingeplant.
+        log(f"⚠️ Abruf für {day_str} unvollständig – Abgleich übersprungen, {os.path.basename(xml_filename)} bleibt unverändert.")
+        return xml_filename, EventChangeSet(unchanged=events)
+
+    # Vor dem Überschreiben mit der letzten Extraktion dieses Tages vergleichen
+    changes = diff_events(read_events_from_xml(xml_filename), events)
+    notify_event_changes(changes, day_str)
+
+    write_events_to_xml(events, xml_filename)
+    return xml_filename, changes
+
+def write_events_to_xml(events, path):
+    root = ET.Element("events")
+    for event in events:
+        root.append(event.to_xml_element())
+    tree = ET.ElementTree(root)
+    tree.write(path, encoding="utf-8", xml_declaration=True)
+    log(f"✅ XML-Datei gespeichert unter '{path}'")
+
+if __name__ == "__main__":
+    filename, extracted = extract_events()
+    print(f"✅ XML-Datei geschrieben: {filename}")
+    print(f"{len(extracted)} relevante Termine extrahiert.")
@@ -0,0 +1,105 @@
+import os
+import threading
+from urllib.parse import urljoin
+import yaml
+from google.auth.credentials import AnonymousCredentials
+from googleapiclient.discovery import build
+from googleapiclient.http import BatchHttpRequest
+
+from modules import youtube_token
+
+# === Basis ===
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(BASE_DIR, ".."))
+
+SCOPES = youtube_token.SCOPES
+CREDENTIALS_PATH = os.path.join(ROOT_DIR, "secrets", "credentials.json")
+TOKEN_PATH = youtube_token.TOKEN_PATH
+
+with open(os.path.join(ROOT_DIR, "config.yaml"), "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+YOUTUBE_CONFIG = config.get("youtube", {})
+# Alternativer API-Endpunkt, z. B. utils/fake_youtube_server.py; leer = Google
+API_ENDPOINT = YOUTUBE_CONFIG.get("api_endpoint") or None
+ANONYMOUS = bool(YOUTUBE_CONFIG.get("anonymous_credentials", False))
+
+# Prozessweiter Client: Signatur von token.json, Credentials und Service
+_cache = {"signature": None, "creds": None, "service": None}
+_lock = threading.Lock()
+
+def _token_signature():
+    try:
+        stat = os.stat(TOKEN_PATH)
+        return (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        return None
+
+def save_credentials(creds):
+    youtube_token.save_credentials(creds)
+
+def load_credentials():
+    """
+    Gültige Credentials über den Token-Manager (Refresh vor Ablauf, prozessübergreifend nur einmal)
+    oder None; Fehler beim Refresh (z. B. invalid_grant) werden weitergereicht.
+    """
+    if ANONYMOUS:
+        return AnonymousCredentials()
+    creds = youtube_token.get_credentials()
+    return creds if creds is not None and creds.valid else None
+
+def build_service(creds):
+    """Baut den Client aus dem mitgelieferten Discovery-Dokument – ohne HTTP-Abruf der API-Beschreibung."""
+    client_options = {"api_endpoint": API_ENDPOINT} if API_ENDPOINT else None
+    return build("youtube", "v3", credentials=creds, static_discovery=True, cache_discovery=False,
+                 client_options=client_options)
+
+def new_batch(service, callback):
+    """
+    BatchHttpRequest zum Client. Die Batch-URL stammt sonst aus dem Discovery-Dokument und
+    würde einen umgestellten api_endpoint ignorieren.
+    """
+    if API_ENDPOINT:
+        return BatchHttpRequest(callback=callback, batch_uri=urljoin(API_ENDPOINT, "batch/youtube/v3"))
+    return service.new_batch_http_request(callback=callback)
+
+def get_service():
+    """
+    Gemeinsamer YouTube-Client pro Prozess. Hat ein anderer Prozess token.json nur erneuert, übernimmt
+    der Client dessen Access Token; neu gebaut wird nur nach einer Neu-Autorisierung. Abgelaufene Tokens
+    erneuert google-auth vor dem nächsten Aufruf über youtube_token.SharedCredentials. None ohne Zugang.
+    """
+    with _lock:
+        signature = _token_signature()
+        if _cache["service"] is not None and _cache["signature"] == signature:
+            return _cache["service"]
+
+        creds = load_credentials()
+        cached = _cache["creds"]
+        if (creds is not None and _cache["service"] is not None
+                and getattr(cached, "refresh_token", None) == getattr(creds, "refresh_token", None)):
+            cached.token, cached.expiry = creds.token, creds.expiry
+            _cache["signature"] = _token_signature()
+            return _cache["service"]
+
+        if creds is None:
+            _cache.update(signature=None, creds=None, service=None)
+            return None
+
+        _cache.update(signature=_token_signature(), creds=creds, service=build_service(creds))
+        return _cache["service"]
+
+def new_service():
+    """
+    Eigener Client mit eigenem HTTP-Transport für Worker-Threads (httplib2.Http ist nicht threadsicher),
+    gebaut aus den Credentials des gemeinsamen Clients. Liefert None ohne gültigen Zugang.
+    """
+    if get_service() is None:
+        return None
+    with _lock:
+        creds = _cache["creds"]
+    return build_service(creds)
+
+def invalidate():
+    """Verwirft den gecachten Client, z. B. nachdem token.json gelöscht oder ersetzt wurde."""
+    with _lock:
+        _cache.update(signature=None, creds=None, service=None)
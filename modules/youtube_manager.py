@@ -1,245 +1,806 @@
-import os
-import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
-import yaml
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from modules.stream_info import StreamInfo
-from modules.telegram_sender import send_telegram_message
-from utils.logger import log
-
-# === Basis & Helper ===
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))          # .../modules
-ROOT_DIR = os.path.abspath(os.path.join(BASE_DIR, ".."))       # Projektstamm
-
-def _abs(path: str) -> str:
-    """Pfad absolut relativ zum Projektstamm auflösen."""
-    return path if os.path.isabs(path) else os.path.join(ROOT_DIR, path)
-
-# === Konfiguration laden (absolut) ===
-with open(os.path.join(ROOT_DIR, "config.yaml"), "r", encoding="utf-8") as f:
-    config = yaml.safe_load(f)
-
-SCOPES = ['https://www.googleapis.com/auth/youtube.force-ssl']
-CREDENTIALS_PATH = os.path.join(ROOT_DIR, "secrets", "credentials.json")
-TOKEN_PATH = os.path.join(ROOT_DIR, "secrets", "token.json")
-XML_PATH = os.path.join(ROOT_DIR, "data")  # Verzeichnis für monatliche XML-Dateien
-
-def get_authenticated_service():
-    creds = None
-
-    # Token laden
-    if os.path.exists(TOKEN_PATH):
-        try:
-            creds = Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)
-        except Exception as e:
-            log(f"⚠️ Fehler beim Laden des gespeicherten Tokens: {e}")
-            creds = None
-
-    # Ungültig oder abgelaufen?
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            try:
-                creds.refresh(Request())
-                log("🔁 Access Token erfolgreich mit refresh_token erneuert.")
-                with open(TOKEN_PATH, "w", encoding="utf-8") as token:
-                    token.write(creds.to_json())
-            except Exception as e:
-                log(f"⚠️ Fehler beim Refresh: {e}")
-                if 'invalid_grant' in str(e).lower():
-                    log("🧨 Refresh-Token ungültig – token.json wird gelöscht.")
-                    try:
-                        os.remove(TOKEN_PATH)
-                    except Exception as ex:
-                        log(f"⚠️ Konnte token.json nicht löschen: {ex}")
-
-                    # Telegram-Hinweis an Sakristei senden
-                    try:
-                        msg = (
-                            "#Sakristei – Fehler bei YouTube Authentifizierung\n"
-                            "❌ Das gespeicherte YouTube-Token ist abgelaufen oder ungültig.\n\n"
-                            "🛠 Bitte führe manuell das Skript `youtube_token_tool` auf dem Kirchenstream-PC aus,\n"
-                            "um die Autorisierung im Browser neu durchzuführen.\n\n"
-                            "Dazu in c:\\Kirchestream das Tool mit 📜`python utils/youtube_token_tool.py` starten"
-                            "📁 Die Datei `secrets/token.json` wird dabei automatisch neu erzeugt.\n"
-                            "Danach läuft alles wieder automatisch."
-                        )
-                        if config["telegram"].get("notify_errors", True):
-                            send_telegram_message(msg)
-                    except Exception as tel_e:
-                        log(f"⚠️ Fehler beim Senden der Telegram-Nachricht: {tel_e}")
-
-                creds = None
-
-        # Kein gültiges Token → im Autonom-Modus keine Neuanmeldung!
-        if not creds or not creds.valid:
-            log("❌ Kein gültiger YouTube-Zugang – automatischer Login deaktiviert.")
-            return None
-
-    return build("youtube", "v3", credentials=creds)
-
-def to_iso_utc(date_str, time_str):
-    local = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
-    year = local.year
-
-    def letzter_sonntag(monat):
-        for tag in range(31, 24, -1):
-            d = datetime(year, monat, tag)
-            if d.weekday() == 6:
-                return d
-
-    dst_start = letzter_sonntag(3).replace(hour=2)
-    dst_end = letzter_sonntag(10).replace(hour=3)
-    offset = timedelta(hours=2 if dst_start <= local < dst_end else 1)
-    utc = local - offset
-    return utc.isoformat("T") + "Z"
-
-def stream_exists_in_xml(event):
-    file_name = f"streams_{event.date[:7]}.xml"
-    path = os.path.join(XML_PATH, file_name)
-    if not os.path.exists(path):
-        return False
-    tree = ET.parse(path)
-    root = tree.getroot()
-    for s in root.findall("stream"):
-        if (s.find("date").text == event.date and
-            s.find("time").text == event.time and
-            s.find("title").text == event.title):
-            return True
-    return False
-
-def stream_exists_on_youtube(service, event):
-    try:
-        broadcasts = service.liveBroadcasts().list(
-            part="snippet",
-            broadcastStatus="upcoming",
-            maxResults=50
-        ).execute()
-
-        target_start = to_iso_utc(event.date, event.time)[:16]  # Minutenvergleich
-
-        for b in broadcasts.get("items", []):
-            snippet = b["snippet"]
-            title_match = snippet["title"].strip() == event.title.strip()
-            start_match = snippet["scheduledStartTime"].startswith(target_start)
-            if title_match and start_match:
-                return True
-    except Exception as e:
-        log(f"⚠️ Fehler bei YouTube-Check: {e}")
-    return False
-
-def create_streams(events, output_dir="youtube_streams_geplant"):
-    output_dir = _abs(output_dir)
-    os.makedirs(output_dir, exist_ok=True)
-    today_str = datetime.today().strftime("%Y-%m-%d")
-    output_filename = os.path.join(output_dir, f"youtube_streams_geplant_{today_str}.txt")
-
-    service = get_authenticated_service()
-    if not service:
-        msg = "#Sakristei – YouTube übersprungen\n⚠️ YouTube-API derzeit nicht verfügbar – geplante Streams werden nicht angelegt."
-        log(msg)
-        if config["telegram"].get("notify_errors", True):
-            send_telegram_message(msg)
-        return []
-
-    all_logs = []
-    stream_infos = []
-    seen = set()
-
-    for event in events:
-        identifier = (event.date, event.time, event.title)
-        if identifier in seen:
-            msg = f"⚠️ Duplikat innerhalb des Laufs ignoriert: {event.date} {event.time} – {event.title}"
-            all_logs.append(msg)
-            log(msg)
-            continue
-        seen.add(identifier)
-
-        if stream_exists_in_xml(event):
-            msg = f"⏭️ Lokaler XML-Abgleich: Stream bereits eingetragen – {event.date} {event.time} – {event.title}"
-            all_logs.append(msg)
-            log(msg)
-            continue
-
-        if stream_exists_on_youtube(service, event):
-            msg = f"⏭️ YouTube-Abgleich: Stream bereits vorhanden – {event.date} {event.time} – {event.title}"
-            all_logs.append(msg)
-            log(msg)
-            continue
-
-        try:
-            iso_time = to_iso_utc(event.date, event.time)
-            log(f"🧪 Termin lokal: {event.date} {event.time}")
-            log(f"📤 scheduledStartTime an YouTube: {iso_time}")
-
-            broadcast_body = {
-                "snippet": {
-                    "title": event.title,
-                    "description": f"Stream aus {event.location}\n📅 {event.date}  🕒 {event.time}",
-                    "scheduledStartTime": iso_time
-                },
-                "status": {
-                    "privacyStatus": "public",
-                    "selfDeclaredMadeForKids": True
-                },
-                "contentDetails": {
-                    "enableAutoStart": True,
-                    "enableAutoStop": True
-                }
-            }
-            broadcast_response = service.liveBroadcasts().insert(
-                part="snippet,status,contentDetails",
-                body=broadcast_body
-            ).execute()
-            broadcast_id = broadcast_response["id"]
-            video_url = f"https://youtube.com/live/{broadcast_id}"
-
-            stream_body = {
-                "snippet": {
-                    "title": f"RTMP für {event.title}"
-                },
-                "cdn": {
-                    "frameRate": "30fps",
-                    "resolution": "1080p",
-                    "ingestionType": "rtmp"
-                }
-            }
-            stream_response = service.liveStreams().insert(
-                part="snippet,cdn",
-                body=stream_body
-            ).execute()
-            stream_id = stream_response["id"]
-            ingestion = stream_response["cdn"]["ingestionInfo"]
-            stream_url = ingestion["ingestionAddress"]
-            stream_key = ingestion["streamName"]
-
-            service.liveBroadcasts().bind(
-                part="id,contentDetails",
-                id=broadcast_id,
-                streamId=stream_id
-            ).execute()
-
-            info = StreamInfo(
-                event.date,
-                event.time,
-                event.title,
-                event.location,
-                stream_url,
-                stream_key,
-                video_url
-            )
-            stream_infos.append(info)
-            all_logs.extend(info.to_log_lines())
-            log(f"✅ Stream erstellt: {event.title} – {event.date} {event.time}")
-
-        except Exception as e:
-            msg = f"❌ Fehler bei Stream-Erstellung: {getattr(event, 'title', 'unbekannt')} – {str(e)}"
-            all_logs.append(msg)
-            log(msg)
-
-    with open(output_filename, "w", encoding="utf-8") as f:
-        f.write("\n".join(all_logs))
-
-    return stream_infos
+import os
+import json
+import math
+import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import yaml
+from googleapiclient.errors import HttpError
+from modules.stream_info import StreamInfo
+from modules.telegram_sender import send_telegram_message
+from modules import youtube_quota, youtube_client, youtube_token, stream_store
+from utils.logger import log
+from utils.file_lock import file_lock
+
+# === Basis & Helper ===
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))          # .../modules
+ROOT_DIR = os.path.abspath(os.path.join(BASE_DIR, ".."))       # Projektstamm
+
+def _abs(path: str) -> str:
+    """Pfad absolut relativ zum Projektstamm auflösen."""
+    return path if os.path.isabs(path) else os.path.join(ROOT_DIR, path)
+
+# === Konfiguration laden (absolut) ===
+with open(os.path.join(ROOT_DIR, "config.yaml"), "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+
+YOUTUBE_CONFIG = config.get("youtube", {})
+BATCH_LIMIT = 50  # max. Aufrufe je BatchHttpRequest
+REUSABLE_STREAMS_PATH = os.path.join(ROOT_DIR, "cache", "youtube_streams.json")
+_verified_streams = {}  # Ort → im aktuellen Prozess bereits geprüfter wiederverwendbarer Stream
+_reusable_lock = threading.Lock()
+
+# Wiederholung vorübergehender Fehler (HTTP 429/5xx, 403 rateLimitExceeded, Netzwerk)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+RETRY_REASONS = {"rateLimitExceeded", "userRateLimitExceeded", "backendError", "internalError"}
+# Inserts sind nicht idempotent: nach Timeout/5xx kann YouTube den Aufruf schon ausgeführt haben →
+# nur Ratenbegrenzungen wiederholen (dort wurde sicher nichts angelegt)
+NON_IDEMPOTENT = {"liveBroadcasts.insert", "liveStreams.insert"}
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+
+# Journal halb angelegter Streams: Termin → erzeugte Broadcast-/Stream-IDs und erreichter Schritt
+JOURNAL_PATH = os.path.join(ROOT_DIR, "status", "youtube_create_journal.json")
+JOURNAL_STALE_HOURS = 6   # unvollständige Einträge fremder Läufe danach zurückbauen
+_journal_lock = threading.Lock()
+
+def get_authenticated_service():
+    try:
+        service = youtube_client.get_service()
+    except Exception as e:
+        log(f"⚠️ Fehler beim Refresh: {e}")
+        service = None
+        if 'invalid_grant' in str(e).lower():
+            log("🧨 Refresh-Token ungültig – token.json wird beiseitegelegt.")
+            try:
+                moved_to = youtube_token.quarantine()
+                if moved_to:
+                    log(f"📁 Ungültiges Token verschoben nach {os.path.basename(moved_to)}")
+            except Exception as ex:
+                log(f"⚠️ Konnte token.json nicht beiseitelegen: {ex}")
+            youtube_client.invalidate()
+
+            # Telegram-Hinweis an Sakristei senden
+            try:
+                msg = (
+                    "#Sakristei – Fehler bei YouTube Authentifizierung\n"
+                    "❌ Das gespeicherte YouTube-Token ist abgelaufen oder ungültig.\n\n"
+                    "🛠 Bitte führe manuell das Skript `youtube_token_tool` auf dem Kirchenstream-PC aus,\n"
+                    "um die Autorisierung im Browser neu durchzuführen.\n\n"
+                    "Dazu in c:\\Kirchestream das Tool mit 📜`python utils/youtube_token_tool.py` starten"
+                    "📁 Die Datei `secrets/token.json` wird dabei automatisch neu erzeugt.\n"
+                    "Danach läuft alles wieder automatisch."
+                )
+                if config["telegram"].get("notify_errors", True):
+                    send_telegram_message(msg)
+            except Exception as tel_e:
+                log(f"⚠️ Fehler beim Senden der Telegram-Nachricht: {tel_e}")
+
+    # Kein gültiges Token → im Autonom-Modus keine Neuanmeldung!
+    if service is None:
+        log("❌ Kein gültiger YouTube-Zugang – automatischer Login deaktiviert.")
+    return service
+
+def to_iso_utc(date_str, time_str):
+    local = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+    year = local.year
+
+    def letzter_sonntag(monat):
+        for tag in range(31, 24, -1):
+            d = datetime(year, monat, tag)
+            if d.weekday() == 6:
+                return d
+
+    dst_start = letzter_sonntag(3).replace(hour=2)
+    dst_end = letzter_sonntag(10).replace(hour=3)
+    offset = timedelta(hours=2 if dst_start <= local < dst_end else 1)
+    utc = local - offset
+    return utc.isoformat("T") + "Z"
+
+def from_iso_utc(iso_str):
+    """Umkehrung von to_iso_utc: scheduledStartTime von YouTube → (Datum, Uhrzeit) in Ortszeit."""
+    utc = datetime.strptime(iso_str[:16], "%Y-%m-%dT%H:%M")
+    for hours in (2, 1):
+        local = utc + timedelta(hours=hours)
+        date_str, time_str = local.strftime("%Y-%m-%d"), local.strftime("%H:%M")
+        if to_iso_utc(date_str, time_str)[:16] == iso_str[:16]:
+            return date_str, time_str
+    local = utc + timedelta(hours=1)
+    return local.strftime("%Y-%m-%d"), local.strftime("%H:%M")
+
+def stream_exists_in_xml(event):
+    """Termin schon lokal eingetragen? Indexabfrage im Stream-Store statt Parsen der Monats-XML."""
+    return stream_store.exists(event.date, event.time, event.title)
+
+def _error_reason(error):
+    try:
+        return json.loads(error.content)["error"]["errors"][0]["reason"]
+    except Exception:
+        return ""
+
+class BatchTransportError(Exception):
+    """Ein ganzer Batch ist ohne Antwort gescheitert – ob die enthaltenen Aufrufe ausgeführt wurden, ist offen."""
+
+    def __init__(self, cause):
+        super().__init__(f"Batch ohne Antwort: {cause}")
+        self.cause = cause
+
+def _is_retryable(error, method=None):
+    if isinstance(error, BatchTransportError):
+        error = error.cause
+    if isinstance(error, HttpError):
+        status = error.resp.status
+        if method in NON_IDEMPOTENT:
+            return status == 429 or (status == 403 and _error_reason(error) in RATE_LIMIT_REASONS)
+        return status in RETRY_STATUS or (status == 403 and _error_reason(error) in RETRY_REASONS)
+    return isinstance(error, OSError) and method not in NON_IDEMPOTENT  # Verbindungsabbruch, Timeout
+
+def _backoff_delay(attempt):
+    """Exponentielles Backoff mit vollem Jitter: zufällig zwischen 0 und base·2^attempt (gedeckelt)."""
+    base = float(YOUTUBE_CONFIG.get("retry_base_seconds", 1))
+    cap = float(YOUTUBE_CONFIG.get("retry_max_seconds", 32))
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+def _call(request, method):
+    """Führt einen Request über das Quota-Ledger aus und wiederholt vorübergehende Fehler."""
+    attempts = int(YOUTUBE_CONFIG.get("retry_attempts", 5))
+    for attempt in range(attempts):
+        try:
+            return youtube_quota.execute(request, method)
+        except Exception as e:
+            if attempt + 1 >= attempts or not _is_retryable(e, method):
+                raise
+            delay = _backoff_delay(attempt)
+            log(f"🔁 {method} fehlgeschlagen ({e}) – Versuch {attempt + 2}/{attempts} in {delay:.1f} s")
+            time.sleep(delay)
+
+def _journal_key(event):
+    return f"{event.date} {event.time} {event.title}"
+
+def _load_journal():
+    try:
+        with open(JOURNAL_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        log(f"⚠️ Anlage-Journal nicht lesbar: {e}")
+        return {}
+
+def _modify_journal(change):
+    with _journal_lock, file_lock(JOURNAL_PATH + ".lock"):
+        journal = _load_journal()
+        change(journal)
+        os.makedirs(os.path.dirname(JOURNAL_PATH), exist_ok=True)
+        tmp_path = f"{JOURNAL_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(journal, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, JOURNAL_PATH)
+
+def _journal_update(event, **fields):
+    """Hält den erreichten Schritt eines Termins fest (state: broadcast → stream → bound)."""
+    def change(journal):
+        entry = journal.setdefault(_journal_key(event), {
+            "date": event.date, "time": event.time, "title": event.title, "location": event.location,
+            "started": datetime.now().isoformat(timespec="seconds"),
+        })
+        entry.update(fields)
+    _modify_journal(change)
+
+def _journal_drop(key):
+    _modify_journal(lambda journal: journal.pop(key, None))
+
+def _normalize_title(title):
+    return " ".join((title or "").split()).casefold()
+
+def _broadcast_key(title, utc_start):
+    """Index-Schlüssel: (normalisierter Titel, UTC-Startzeit auf die Minute genau)."""
+    return (_normalize_title(title), (utc_start or "")[:16])
+
+def fetch_upcoming_index(service):
+    """
+    Lädt ALLE geplanten Broadcasts (über sämtliche Seiten) einmal pro Lauf und
+    liefert ein Set von (normalisierter Titel, UTC-Minute) für den Duplikat-Check.
+    """
+    index = set()
+    page_token = None
+    pages = 0
+    while True:
+        response = _call(service.liveBroadcasts().list(
+            part="snippet",
+            broadcastStatus="upcoming",
+            maxResults=50,
+            pageToken=page_token
+        ), "liveBroadcasts.list")
+        pages += 1
+        for b in response.get("items", []):
+            snippet = b["snippet"]
+            index.add(_broadcast_key(snippet["title"], snippet.get("scheduledStartTime")))
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+    log(f"📋 {len(index)} geplante YouTube-Broadcasts geladen ({pages} Seite(n)).")
+    return index
+
+def stream_exists_on_youtube(upcoming_index, event):
+    return _broadcast_key(event.title, to_iso_utc(event.date, event.time)) in upcoming_index
+
+def _broadcast_body(event, iso_time):
+    return {
+        "snippet": {
+            "title": event.title,
+            "description": f"Stream aus {event.location}\n📅 {event.date}  🕒 {event.time}",
+            "scheduledStartTime": iso_time
+        },
+        "status": {
+            "privacyStatus": "public",
+            "selfDeclaredMadeForKids": True
+        },
+        "contentDetails": {
+            "enableAutoStart": True,
+            "enableAutoStop": True
+        }
+    }
+
+def _stream_body(event):
+    return {
+        "snippet": {
+            "title": f"RTMP für {event.title}" if event is not None else "RTMP"
+        },
+        "cdn": {
+            "frameRate": "30fps",
+            "resolution": "1080p",
+            "ingestionType": "rtmp"
+        }
+    }
+
+def _load_reusable_streams():
+    try:
+        with open(REUSABLE_STREAMS_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        log(f"⚠️ Cache der wiederverwendbaren Streams nicht lesbar: {e}")
+        return {}
+
+def _save_reusable_streams(streams):
+    os.makedirs(os.path.dirname(REUSABLE_STREAMS_PATH), exist_ok=True)
+    tmp_path = REUSABLE_STREAMS_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(streams, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, REUSABLE_STREAMS_PATH)
+
+def get_reusable_stream(service, location):
+    """
+    Liefert den dauerhaften, wiederverwendbaren RTMP-Stream für einen Ort (als liveStreams-Ressource).
+    Reihenfolge: Prozess-Cache → lokaler Cache (kurz bei YouTube geprüft) → Suche nach Titel → neu anlegen.
+    """
+    with _reusable_lock:
+        return _get_reusable_stream(service, location)
+
+def _get_reusable_stream(service, location):
+    if location in _verified_streams:
+        return _verified_streams[location]
+
+    title = f"Kirchenstream – {location}"
+    cached = _load_reusable_streams()
+    stream = None
+
+    if location in cached:
+        response = _call(
+            service.liveStreams().list(part="id,snippet,cdn", id=cached[location]["stream_id"]),
+            "liveStreams.list"
+        )
+        if response.get("items"):
+            stream = response["items"][0]
+        else:
+            log(f"⚠️ Wiederverwendbarer Stream für {location} existiert nicht mehr – wird neu ermittelt.")
+
+    if stream is None:
+        page_token = None
+        while stream is None:
+            response = _call(service.liveStreams().list(
+                part="id,snippet,cdn,contentDetails",
+                mine=True,
+                maxResults=50,
+                pageToken=page_token
+            ), "liveStreams.list")
+            for item in response.get("items", []):
+                if item["snippet"]["title"] == title and item.get("contentDetails", {}).get("isReusable", True):
+                    stream = item
+                    break
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+
+    if stream is None:
+        body = _stream_body(None)
+        body["snippet"]["title"] = title
+        body["contentDetails"] = {"isReusable": True}
+        stream = _call(
+            service.liveStreams().insert(part="snippet,cdn,contentDetails", body=body),
+            "liveStreams.insert"
+        )
+        log(f"🆕 Wiederverwendbarer Stream für {location} angelegt: {stream['id']}")
+
+    ingestion = stream["cdn"]["ingestionInfo"]
+    cached[location] = {
+        "stream_id": stream["id"],
+        "stream_url": ingestion["ingestionAddress"],
+        "stream_key": ingestion["streamName"],
+    }
+    _save_reusable_streams(cached)
+    _verified_streams[location] = stream
+    return stream
+
+def _stream_fields(stream_response):
+    ingestion = stream_response["cdn"]["ingestionInfo"]
+    return {
+        "stream_id": stream_response["id"],
+        "stream_url": ingestion["ingestionAddress"],
+        "stream_key": ingestion["streamName"],
+    }
+
+def _stream_info(event, entry):
+    return StreamInfo(
+        event.date,
+        event.time,
+        event.title,
+        event.location,
+        entry["stream_url"],
+        entry["stream_key"],
+        f"https://youtube.com/live/{entry['broadcast_id']}"
+    )
+
+def _rollback(service, key, entry):
+    """
+    Baut halb angelegte Ressourcen eines Termins ab, damit kein verwaister Broadcast die
+    Duplikatprüfung des nächsten Laufs blockiert. Wiederverwendbare Streams bleiben bestehen.
+    Schlägt der Rückbau fehl, bleibt der Journal-Eintrag für den nächsten Lauf erhalten.
+    """
+    targets = []
+    if entry.get("broadcast_id"):
+        targets.append(("broadcast_id", service.liveBroadcasts(), "liveBroadcasts.delete"))
+    if entry.get("stream_id") and not entry.get("stream_reused"):
+        targets.append(("stream_id", service.liveStreams(), "liveStreams.delete"))
+
+    for field, resource, method in targets:
+        try:
+            _call(resource.delete(id=entry[field]), method)
+            log(f"↩️ Rückbau {key}: {method} {entry[field]}")
+        except HttpError as e:
+            if e.resp.status != 404:
+                log(f"⚠️ Rückbau {key} fehlgeschlagen ({method}): {e}")
+                return False
+        except Exception as e:
+            log(f"⚠️ Rückbau {key} fehlgeschlagen ({method}): {e}")
+            return False
+    _journal_drop(key)
+    return True
+
+def retire_streams(events):
+    """
+    Streams entfallener bzw. verschobener Termine zurückziehen: Broadcast auf YouTube löschen und
+    den Eintrag im Stream-Store als tot markieren, damit Tageslauf und OBS ihn nicht mehr starten.
+    Bereits begonnene Termine bleiben unangetastet (die Aufzeichnung soll nicht verloren gehen).
+    Der Eintrag wird auch dann tot markiert, wenn das Löschen auf YouTube scheitert.
+    """
+    now = datetime.now()
+    targets = []
+    for event in events:
+        record = stream_store.find(event.date, event.time, event.title)
+        if record is None:
+            continue
+        if datetime.strptime(f"{event.date} {event.time}", "%Y-%m-%d %H:%M") <= now:
+            log(f"ℹ️ Termin bereits begonnen, Stream bleibt: {event.date} {event.time} – {event.title}")
+            continue
+        targets.append((event, record))
+    if not targets:
+        return 0
+
+    service = get_authenticated_service()
+    failed = []
+    for event, record in targets:
+        broadcast_id = record.get("broadcast_id")
+        if not broadcast_id:
+            log(f"⚠️ Kein Broadcast zu {event.date} {event.time} – {event.title} hinterlegt, bitte manuell prüfen.")
+            continue
+        if service is None:
+            failed.append(event)
+        else:
+            try:
+                _call(service.liveBroadcasts().delete(id=broadcast_id), "liveBroadcasts.delete")
+                log(f"🗑️ Broadcast gelöscht: {event.date} {event.time} – {event.title} ({broadcast_id})")
+            except HttpError as e:
+                if e.resp.status != 404:
+                    log(f"⚠️ Löschen von Broadcast {broadcast_id} fehlgeschlagen: {e}")
+                    failed.append(event)
+            except Exception as e:
+                log(f"⚠️ Löschen von Broadcast {broadcast_id} fehlgeschlagen: {e}")
+                failed.append(event)
+        stream_store.mark_dead(broadcast_id)
+        log(f"💀 Stream zurückgezogen: {event.date} {event.time} – {event.title}")
+
+    if failed and config["telegram"].get("notify_errors", True):
+        msg = "#Sakristei – YouTube\n⚠️ Broadcasts entfallener Termine nicht gelöscht (werden nicht gestartet):\n"
+        msg += "\n".join(f"• {e.date} {e.time} – {e.title}" for e in failed)
+        send_telegram_message(msg)
+    return len(targets)
+
+def _create_stream_sequential(service, event, entry=None):
+    """
+    Broadcast anlegen, RTMP-Stream anlegen, beide binden – drei Aufrufe nacheinander.
+    Jeder Schritt wird im Journal vermerkt; ein übergebener Eintrag setzt eine unterbrochene Anlage fort.
+    Scheitert ein Schritt endgültig, werden die bereits angelegten Ressourcen wieder entfernt.
+    """
+    entry = dict(entry or {})
+    iso_time = to_iso_utc(event.date, event.time)
+    log(f"🧪 Termin lokal: {event.date} {event.time}")
+    log(f"📤 scheduledStartTime an YouTube: {iso_time}")
+
+    try:
+        if not entry.get("broadcast_id"):
+            broadcast_response = _call(service.liveBroadcasts().insert(
+                part="snippet,status,contentDetails",
+                body=_broadcast_body(event, iso_time)
+            ), "liveBroadcasts.insert")
+            entry.update(state="broadcast", broadcast_id=broadcast_response["id"])
+            _journal_update(event, state="broadcast", broadcast_id=entry["broadcast_id"])
+
+        if not entry.get("stream_id"):
+            reuse = YOUTUBE_CONFIG.get("reuse_stream", False)
+            if reuse:
+                stream_response = get_reusable_stream(service, event.location)
+            else:
+                stream_response = _call(service.liveStreams().insert(
+                    part="snippet,cdn",
+                    body=_stream_body(event)
+                ), "liveStreams.insert")
+            entry.update(state="stream", stream_reused=reuse, **_stream_fields(stream_response))
+            _journal_update(event, state="stream", stream_reused=reuse, **_stream_fields(stream_response))
+
+        if entry.get("state") != "bound":
+            _call(service.liveBroadcasts().bind(
+                part="id,contentDetails",
+                id=entry["broadcast_id"],
+                streamId=entry["stream_id"]
+            ), "liveBroadcasts.bind")
+            entry["state"] = "bound"
+            _journal_update(event, state="bound")
+    except Exception:
+        _rollback(service, _journal_key(event), entry)
+        raise
+
+    return _stream_info(event, entry)
+
+def _run_batches(service, requests, results, caller="main"):
+    def callback(request_id, response, exception):
+        results[request_id] = (response, exception)
+
+    for i in range(0, len(requests), BATCH_LIMIT):
+        chunk = requests[i:i + BATCH_LIMIT]
+        batch = youtube_client.new_batch(service, callback)
+        for request_id, request, _ in chunk:
+            batch.add(request, request_id=request_id)
+        try:
+            batch.execute()
+        except Exception as e:
+            # Der ganze Batch ist gescheitert → Ergebnis der Aufrufe ohne Antwort ist unbekannt
+            for request_id, _, _ in chunk:
+                results.setdefault(request_id, (None, BatchTransportError(e)))
+        finally:
+            methods = {}
+            for _, _, method in chunk:
+                methods[method] = methods.get(method, 0) + 1
+            for method, count in methods.items():
+                youtube_quota.record(method, caller=caller, count=count)
+
+def execute_batch(service, requests, caller="main"):
+    """
+    Führt (request_id, HttpRequest, Methode)-Tupel in BatchHttpRequests zu je BATCH_LIMIT Aufrufen aus
+    und verbucht jeden Einzelaufruf im Quota-Ledger. Vorübergehend gescheiterte Einzelaufrufe werden
+    mit Backoff in einem neuen Batch wiederholt. Liefert {request_id: (response, exception)}.
+    """
+    results = {}
+    attempts = int(YOUTUBE_CONFIG.get("retry_attempts", 5))
+    todo = requests
+    for attempt in range(attempts):
+        for request_id, _, _ in todo:
+            results.pop(request_id, None)
+        _run_batches(service, todo, results, caller)
+        todo = [r for r in todo
+                if results.get(r[0], (None, None))[1] is not None and _is_retryable(results[r[0]][1], r[2])]
+        if not todo or attempt + 1 >= attempts:
+            break
+        delay = _backoff_delay(attempt)
+        log(f"🔁 {len(todo)} Batch-Aufruf(e) vorübergehend fehlgeschlagen – Versuch {attempt + 2}/{attempts} in {delay:.1f} s")
+        time.sleep(delay)
+    return results
+
+def _list_pages(make_request, method):
+    """Alle Einträge einer list-Methode über sämtliche Seiten (make_request(page_token) → HttpRequest)."""
+    page_token = None
+    while True:
+        response = _call(make_request(page_token), method)
+        yield from response.get("items", [])
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return
+
+def _recover_unknown_inserts(service, events, iso_times, created):
+    """
+    Nach einem Batch ohne Antwort können Inserts trotzdem ausgeführt worden sein. Bevor sie als
+    nicht angelegt gelten (und beim nächsten Lauf doppelt entstehen), werden Broadcasts über Titel und
+    Startzeit, eigene Streams über ihren Titel unter den noch ungebundenen Streams gesucht und übernommen.
+    """
+    unknown = {rid for rid, (_, error) in created.items() if isinstance(error, BatchTransportError)}
+    if not unknown:
+        return
+    broadcasts = list(_list_pages(lambda token: service.liveBroadcasts().list(
+        part="snippet,contentDetails", broadcastStatus="upcoming", maxResults=50, pageToken=token
+    ), "liveBroadcasts.list"))
+    by_key = {_broadcast_key(b["snippet"]["title"], b["snippet"].get("scheduledStartTime")): b for b in broadcasts}
+
+    streams = []
+    if any(rid.startswith("stream-") for rid in unknown):
+        taken = {b.get("contentDetails", {}).get("boundStreamId") for b in broadcasts}
+        taken |= {response["id"] for response, _ in created.values() if response}
+        streams = [st for st in _list_pages(lambda token: service.liveStreams().list(
+            part="snippet,cdn", mine=True, maxResults=50, pageToken=token
+        ), "liveStreams.list") if st["id"] not in taken]
+
+    recovered = 0
+    for i, event in enumerate(events):
+        if f"broadcast-{i}" in unknown:
+            broadcast = by_key.pop(_broadcast_key(event.title, iso_times[i]), None)
+            if broadcast:
+                created[f"broadcast-{i}"] = (broadcast, None)
+                recovered += 1
+        if f"stream-{i}" in unknown:
+            title = _stream_body(event)["snippet"]["title"]
+            stream = next((st for st in streams if st["snippet"].get("title") == title), None)
+            if stream:
+                streams.remove(stream)
+                created[f"stream-{i}"] = (stream, None)
+                recovered += 1
+    log(f"🔎 Batch ohne Antwort: {recovered} von {len(unknown)} Insert(s) auf YouTube gefunden und übernommen.")
+
+def _create_streams_batched(service, events):
+    """
+    Legt Broadcasts und RTMP-Streams aller Termine gemeinsam in Batch-Requests an und
+    bindet sie danach in einem zweiten Batch. Liefert [(event, StreamInfo oder None, Fehler oder None)].
+    """
+    reuse = YOUTUBE_CONFIG.get("reuse_stream", False)
+    reusable = {}
+    if reuse:
+        for event in events:
+            if event.location not in reusable:
+                reusable[event.location] = get_reusable_stream(service, event.location)
+
+    iso_times = {}
+    inserts = []
+    for i, event in enumerate(events):
+        iso_times[i] = to_iso_utc(event.date, event.time)
+        log(f"📤 Batch: {event.date} {event.time} – {event.title} (scheduledStartTime {iso_times[i]})")
+        inserts.append((f"broadcast-{i}", service.liveBroadcasts().insert(
+            part="snippet,status,contentDetails",
+            body=_broadcast_body(event, iso_times[i])
+        ), "liveBroadcasts.insert"))
+        if not reuse:
+            inserts.append((f"stream-{i}", service.liveStreams().insert(
+                part="snippet,cdn",
+                body=_stream_body(event)
+            ), "liveStreams.insert"))
+    created = execute_batch(service, inserts)
+    try:
+        _recover_unknown_inserts(service, events, iso_times, created)
+    except Exception as e:
+        log(f"⚠️ Abgleich nach Batch ohne Antwort fehlgeschlagen: {e}")
+    if reuse:
+        for i, event in enumerate(events):
+            created[f"stream-{i}"] = (reusable[event.location], None)
+
+    results = {}
+    entries = {}
+    binds = []
+    for i, event in enumerate(events):
+        broadcast, broadcast_error = created.get(f"broadcast-{i}", (None, None))
+        stream, stream_error = created.get(f"stream-{i}", (None, None))
+        entry = entries[i] = {"stream_reused": reuse}
+        if broadcast:
+            entry.update(state="broadcast", broadcast_id=broadcast["id"])
+        if stream:
+            entry.update(_stream_fields(stream))
+        if broadcast or (stream and not reuse):
+            _journal_update(event, **entry)
+
+        error = broadcast_error or stream_error
+        if error or not broadcast or not stream:
+            results[i] = (None, error or RuntimeError("keine Antwort im Batch"))
+            _rollback(service, _journal_key(event), entry)
+            continue
+        entry["state"] = "stream"
+        _journal_update(event, state="stream")
+        binds.append((f"bind-{i}", service.liveBroadcasts().bind(
+            part="id,contentDetails",
+            id=broadcast["id"],
+            streamId=stream["id"]
+        ), "liveBroadcasts.bind"))
+    bound = execute_batch(service, binds) if binds else {}
+
+    for request_id, _, _ in binds:
+        i = int(request_id.split("-")[1])
+        _, bind_error = bound.get(request_id, (None, RuntimeError("keine Antwort im Batch")))
+        if bind_error:
+            results[i] = (None, bind_error)
+            _rollback(service, _journal_key(events[i]), entries[i])
+        else:
+            _journal_update(events[i], state="bound")
+            results[i] = (_stream_info(events[i], entries[i]), None)
+
+    round_trips = math.ceil(len(inserts) / BATCH_LIMIT) + math.ceil(len(binds) / BATCH_LIMIT)
+    log(f"📦 Batch-Anlage: {len(inserts) + len(binds)} Aufrufe in {round_trips} HTTP-Round-Trips.")
+    return [(event, *results[i]) for i, event in enumerate(events)]
+
+def _create_streams_concurrent(events):
+    """
+    Legt die Termine parallel mit höchstens youtube.max_workers Threads an, jeder Thread mit eigenem
+    Client/HTTP-Transport. Ergebnisse kommen in der Reihenfolge der Termine zurück: [(event, StreamInfo, Fehler)].
+    """
+    workers = max(1, min(int(YOUTUBE_CONFIG.get("max_workers", 4)), len(events)))
+    local = threading.local()
+
+    def create(event):
+        try:
+            service = getattr(local, "service", None)
+            if service is None:
+                service = youtube_client.new_service()
+                if service is None:
+                    raise RuntimeError("kein gültiger YouTube-Zugang")
+                local.service = service
+            return (event, _create_stream_sequential(service, event), None)
+        except Exception as e:
+            return (event, None, e)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(create, events))
+    log(f"🧵 Parallele Anlage: {len(events)} Termin(e) mit {workers} Worker(n) in {time.perf_counter() - started:.1f} s.")
+    return results
+
+def _journal_for_run(service, events):
+    """
+    Liefert die Journal-Einträge der Termine dieses Laufs. Fertige Einträge vergangener Tage werden
+    entfernt, unvollständige Einträge anderer Termine nach JOURNAL_STALE_HOURS zurückgebaut.
+    """
+    journal = _load_journal()
+    keys = {_journal_key(event) for event in events}
+    today = datetime.today().strftime("%Y-%m-%d")
+    stale_before = (datetime.now() - timedelta(hours=JOURNAL_STALE_HOURS)).isoformat(timespec="seconds")
+
+    for key, entry in journal.items():
+        if key in keys:
+            continue
+        if entry.get("state") == "bound":
+            if entry.get("date", "") < today:
+                _journal_drop(key)
+        elif entry.get("started", "") < stale_before:
+            log(f"🧹 Verwaiste, unvollständige Anlage aus früherem Lauf wird zurückgebaut: {key}")
+            _rollback(service, key, entry)
+
+    return {key: entry for key, entry in journal.items() if key in keys}
+
+def create_streams(events, output_dir="youtube_streams_geplant"):
+    output_dir = _abs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    today_str = datetime.today().strftime("%Y-%m-%d")
+    output_filename = os.path.join(output_dir, f"youtube_streams_geplant_{today_str}.txt")
+
+    service = get_authenticated_service()
+    if not service:
+        msg = "#Sakristei – YouTube übersprungen\n⚠️ YouTube-API derzeit nicht verfügbar – geplante Streams werden nicht angelegt."
+        log(msg)
+        if config["telegram"].get("notify_errors", True):
+            send_telegram_message(msg)
+        return []
+
+    all_logs = []
+    stream_infos = []
+    seen = set()
+    pending = []
+
+    try:
+        upcoming_index = fetch_upcoming_index(service)
+    except Exception as e:
+        log(f"⚠️ Fehler bei YouTube-Check: {e}")
+        upcoming_index = set()
+
+    journal = _journal_for_run(service, events)
+    recovered = []   # fertig angelegt, aber vor dem XML-Eintrag unterbrochen
+    resume = []      # mitten in der Anlage unterbrochen
+
+    for event in events:
+        identifier = (event.date, event.time, event.title)
+        if identifier in seen:
+            msg = f"⚠️ Duplikat innerhalb des Laufs ignoriert: {event.date} {event.time} – {event.title}"
+            all_logs.append(msg)
+            log(msg)
+            continue
+        seen.add(identifier)
+        entry = journal.get(_journal_key(event))
+
+        if stream_exists_in_xml(event):
+            if entry and entry.get("state") == "bound":
+                _journal_drop(_journal_key(event))
+            elif entry:
+                _rollback(service, _journal_key(event), entry)
+            msg = f"⏭️ Lokaler XML-Abgleich: Stream bereits eingetragen – {event.date} {event.time} – {event.title}"
+            all_logs.append(msg)
+            log(msg)
+            continue
+
+        if entry and entry.get("state") == "bound":
+            msg = f"♻️ Journal: Stream war bereits angelegt, wird übernommen – {event.date} {event.time} – {event.title}"
+            all_logs.append(msg)
+            log(msg)
+            recovered.append((event, _stream_info(event, entry), None))
+            continue
+
+        if entry:
+            # Der eigene halbe Broadcast würde sonst vom YouTube-Abgleich als Duplikat gewertet
+            log(f"♻️ Journal: setze unterbrochene Anlage fort – {event.date} {event.time} – {event.title}")
+            resume.append((event, entry))
+            continue
+
+        if stream_exists_on_youtube(upcoming_index, event):
+            msg = f"⏭️ YouTube-Abgleich: Stream bereits vorhanden – {event.date} {event.time} – {event.title}"
+            all_logs.append(msg)
+            log(msg)
+            continue
+
+        pending.append(event)
+
+    results = recovered
+    for event, entry in resume:
+        try:
+            results.append((event, _create_stream_sequential(service, event, entry), None))
+        except Exception as e:
+            results.append((event, None, e))
+
+    mode = YOUTUBE_CONFIG.get("create_mode", "sequential")
+    if mode == "batch" and pending:
+        try:
+            results += _create_streams_batched(service, pending)
+        except Exception as e:
+            results += [(event, None, e) for event in pending]
+    elif mode == "concurrent" and pending:
+        results += _create_streams_concurrent(pending)
+    else:
+        for event in pending:
+            try:
+                results.append((event, _create_stream_sequential(service, event), None))
+            except Exception as e:
+                results.append((event, None, e))
+
+    for event, info, error in results:
+        if error is not None:
+            msg = f"❌ Fehler bei Stream-Erstellung: {getattr(event, 'title', 'unbekannt')} – {str(error)}"
+            all_logs.append(msg)
+            log(msg)
+            continue
+
+        stream_infos.append(info)
+        upcoming_index.add(_broadcast_key(event.title, to_iso_utc(event.date, event.time)))
+        all_logs.extend(info.to_log_lines())
+        log(f"✅ Stream erstellt: {event.title} – {event.date} {event.time}")
+
+    quota_line = f"📊 YouTube-Quota heute: {youtube_quota.usage_summary()}"
+    all_logs.append(quota_line)
+    log(quota_line)
+
+    with open(output_filename, "w", encoding="utf-8") as f:
+        f.write("\n".join(all_logs))
+
+    return stream_infos
@@ -0,0 +1,126 @@
+import os
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+import yaml
+
+from utils.logger import log
+from utils.file_lock import file_lock
+
+# === Basis & Konfiguration ===
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(BASE_DIR, ".."))
+with open(os.path.join(ROOT_DIR, "config.yaml"), "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+YOUTUBE_CONFIG = config.get("youtube", {})
+
+# Gegen einen lokalen Ersatz-Endpunkt (utils/fake_youtube_server.py) getrennt buchen
+LEDGER_PATH = os.path.join(ROOT_DIR, "status", "youtube_quota_local.json" if YOUTUBE_CONFIG.get("api_endpoint")
+                           else "youtube_quota.json")
+LOCK_PATH = LEDGER_PATH + ".lock"
+MAX_CALLS_KEPT = 200    # letzte Einzelaufrufe mit Zeitstempel im Ledger
+MAX_HISTORY_DAYS = 30
+
+# Dokumentierte Kosten der YouTube Data API v3 (Einheiten je Aufruf)
+QUOTA_COSTS = {
+    "liveBroadcasts.list": 1,
+    "liveBroadcasts.insert": 50,
+    "liveBroadcasts.bind": 50,
+    "liveBroadcasts.delete": 50,
+    "liveStreams.list": 1,
+    "liveStreams.insert": 50,
+    "liveStreams.delete": 50,
+    "channels.list": 1,
+    "playlistItems.list": 1,
+    "videos.list": 1,
+    "videos.delete": 50,
+    "search.list": 100,
+}
+
+class QuotaBudgetExceeded(Exception):
+    """Aufruf mit niedriger Priorität abgelehnt, weil das Tagesbudget fast aufgebraucht ist."""
+
+_lock = threading.Lock()
+
+def _quota_day():
+    """Das Google-Kontingent wird um Mitternacht pazifischer Zeit zurückgesetzt."""
+    try:
+        from zoneinfo import ZoneInfo
+        return datetime.now(ZoneInfo("America/Los_Angeles")).strftime("%Y-%m-%d")
+    except Exception:
+        return (datetime.now(timezone.utc) - timedelta(hours=8)).strftime("%Y-%m-%d")
+
+def _read_ledger():
+    try:
+        with open(LEDGER_PATH, "r", encoding="utf-8") as f:
+            ledger = json.load(f)
+    except FileNotFoundError:
+        ledger = {}
+    except Exception as e:
+        log(f"⚠️ Quota-Ledger nicht lesbar, beginne neu: {e}")
+        ledger = {}
+
+    day = _quota_day()
+    if ledger.get("date") != day:
+        history = ledger.get("history", {})
+        if ledger.get("date"):
+            history[ledger["date"]] = ledger.get("total", 0)
+        history = dict(sorted(history.items())[-MAX_HISTORY_DAYS:])
+        ledger = {"date": day, "total": 0, "by_method": {}, "by_caller": {}, "calls": [], "history": history}
+    return ledger
+
+def _write_ledger(ledger):
+    os.makedirs(os.path.dirname(LEDGER_PATH), exist_ok=True)
+    tmp_path = f"{LEDGER_PATH}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(ledger, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, LEDGER_PATH)
+
+def daily_limit():
+    return int(YOUTUBE_CONFIG.get("quota_daily_limit", 10000))
+
+def get_usage():
+    """Aktueller Tagesstand: {"date", "total", "limit", "by_method", "by_caller", "history"}."""
+    with _lock:
+        ledger = _read_ledger()
+    ledger["limit"] = daily_limit()
+    return ledger
+
+def usage_summary():
+    usage = get_usage()
+    percent = 100 * usage["total"] / usage["limit"] if usage["limit"] else 0
+    return f"{usage['total']} / {usage['limit']} Einheiten ({percent:.0f} %) am {usage['date']}"
+
+def record(method, caller="main", count=1):
+    """Verbucht count Aufrufe von method mit ihren dokumentierten Kosten im Tages-Ledger."""
+    units = QUOTA_COSTS.get(method, 1) * count
+    with _lock, file_lock(LOCK_PATH):
+        ledger = _read_ledger()
+        ledger["total"] += units
+        ledger["by_method"][method] = ledger["by_method"].get(method, 0) + units
+        ledger["by_caller"][caller] = ledger["by_caller"].get(caller, 0) + units
+        ledger["calls"].append([datetime.now().isoformat(timespec="seconds"), method, units, caller])
+        ledger["calls"] = ledger["calls"][-MAX_CALLS_KEPT:]
+        _write_ledger(ledger)
+    return units
+
+def check_budget(method, priority="high", count=1):
+    """
+    Niedrige Priorität (Dashboard-Abfragen, Bereinigung) wird gebremst, sobald der Tagesverbrauch
+    youtube.quota_low_priority_threshold (Anteil des Limits) erreichen würde.
+    """
+    if priority != "low":
+        return
+    threshold = float(YOUTUBE_CONFIG.get("quota_low_priority_threshold", 0.8)) * daily_limit()
+    with _lock:
+        used = _read_ledger()["total"]
+    if used + QUOTA_COSTS.get(method, 1) * count > threshold:
+        raise QuotaBudgetExceeded(f"YouTube-Quota fast erschöpft ({used}/{daily_limit()}) – {method} übersprungen")
+
+def execute(request, method, caller="main", priority="high"):
+    """Führt einen googleapiclient-Request aus und verbucht ihn (auch fehlgeschlagene Aufrufe kosten Quota)."""
+    check_budget(method, priority)
+    try:
+        return request.execute()
+    finally:
+        record(method, caller)
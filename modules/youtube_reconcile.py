@@ -0,0 +1,230 @@
+import os
+from datetime import datetime, timedelta
+import yaml
+
+from modules.stream_info import StreamInfo
+from modules import stream_store
+from modules.xml_writer import append_stream_to_monthly_xml
+from modules.telegram_sender import send_telegram_message
+from modules.youtube_manager import (
+    YOUTUBE_CONFIG, BATCH_LIMIT, _call, _stream_body, _stream_fields,
+    from_iso_utc, get_authenticated_service, get_reusable_stream
+)
+from utils.logger import log
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(BASE_DIR, ".."))
+with open(os.path.join(ROOT_DIR, "config.yaml"), "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+
+ACTIVE_WINDOW_HOURS = 3      # so lange nach Beginn kann ein Eintrag noch live sein
+DEAD_STATES = {"complete", "revoked"}
+
+def _chunks(items, size=BATCH_LIMIT):
+    items = list(items)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+class ReconcilePlan:
+    """
+    Reparaturplan zwischen Stream-Store und YouTube. Einträge sind Dicts mit date, time, title,
+    location, broadcast_id sowie je nach Aktion stream_url/stream_key und bind (Broadcast ohne Stream).
+      add       – Broadcast auf YouTube, lokal unbekannt → in den Store übernehmen
+      mark_dead – lokaler Eintrag, dessen Broadcast gelöscht/beendet wurde → als tot markieren
+      rebind    – Broadcast ohne/mit anderem Stream → neu binden bzw. Key/URL lokal nachziehen
+    """
+
+    def __init__(self):
+        self.add = []
+        self.mark_dead = []
+        self.rebind = []
+        self.api_calls = 0
+
+    def is_empty(self):
+        return not (self.add or self.mark_dead or self.rebind)
+
+    def summary(self):
+        return (f"➕ {len(self.add)} neu, 💀 {len(self.mark_dead)} tot, "
+                f"🔗 {len(self.rebind)} neu gebunden ({self.api_calls} API-Aufrufe)")
+
+    def lines(self):
+        lines = []
+        for item in self.add:
+            lines.append(f"➕ {item['date']} {item['time']} – {item['title']} ({item['broadcast_id']})")
+        for item in self.mark_dead:
+            lines.append(f"💀 {item['date']} {item['time']} – {item['title']} ({item['broadcast_id']})")
+        for item in self.rebind:
+            target = "neuer Stream" if item["bind"] else f"Key {item['stream_key']}"
+            lines.append(f"🔗 {item['date']} {item['time']} – {item['title']} ({item['broadcast_id']}) → {target}")
+        return lines
+
+def load_local_records(now=None):
+    """Alle nicht toten Einträge ab jetzt (bzw. seit ACTIVE_WINDOW_HOURS) aus dem Stream-Store: {broadcast_id: Dict}."""
+    now = now or datetime.now()
+    since = now - timedelta(hours=ACTIVE_WINDOW_HOURS)
+    records = {}
+    for s in stream_store.streams_between(since.strftime("%Y-%m-%d"), "9999-12-31"):
+        start = datetime.strptime(f"{s['date']} {s['time']}", "%Y-%m-%d %H:%M")
+        if start < since or not s["broadcast_id"]:
+            continue
+        records[s["broadcast_id"]] = {
+            "start": start,
+            "date": s["date"],
+            "time": s["time"],
+            "title": s["title"],
+            "location": s["location"],
+            "stream_url": s["url"],
+            "stream_key": s["key"],
+            "broadcast_id": s["broadcast_id"],
+        }
+    return records
+
+def fetch_remote(service, plan):
+    """Alle geplanten und laufenden Broadcasts (seitenweise, je 50) samt gebundener Streams (je 50 IDs pro Aufruf)."""
+    broadcasts = {}
+    for status in ("upcoming", "active"):
+        page_token = None
+        while True:
+            response = _call(service.liveBroadcasts().list(
+                part="id,snippet,status,contentDetails",
+                broadcastStatus=status,
+                maxResults=50,
+                pageToken=page_token
+            ), "liveBroadcasts.list")
+            plan.api_calls += 1
+            for b in response.get("items", []):
+                broadcasts[b["id"]] = b
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+
+    stream_ids = {b.get("contentDetails", {}).get("boundStreamId") for b in broadcasts.values()} - {None}
+    streams = {}
+    for chunk in _chunks(stream_ids):
+        response = _call(service.liveStreams().list(part="id,snippet,cdn", id=",".join(chunk),
+                                                    maxResults=50), "liveStreams.list")
+        plan.api_calls += 1
+        for stream in response.get("items", []):
+            streams[stream["id"]] = stream
+    return broadcasts, streams
+
+def lookup_broadcasts(service, broadcast_ids, plan):
+    """Status lokal bekannter, aber nicht mehr geplanter Broadcasts – je 50 IDs pro Aufruf."""
+    found = {}
+    for chunk in _chunks(broadcast_ids):
+        response = _call(service.liveBroadcasts().list(part="id,status", id=",".join(chunk),
+                                                       maxResults=50), "liveBroadcasts.list")
+        plan.api_calls += 1
+        for b in response.get("items", []):
+            found[b["id"]] = b
+    return found
+
+def _location_from_description(description):
+    first_line = (description or "").split("\n")[0]
+    return first_line[len("Stream aus "):].strip() if first_line.startswith("Stream aus ") else "YouTube"
+
+def build_plan(service, records, now=None):
+    now = now or datetime.now()
+    plan = ReconcilePlan()
+    broadcasts, streams = fetch_remote(service, plan)
+
+    missing = [bid for bid in records if bid not in broadcasts]
+    found = lookup_broadcasts(service, missing, plan) if missing else {}
+
+    for bid, record in records.items():
+        item = {k: record[k] for k in ("date", "time", "title", "location", "broadcast_id", "stream_url", "stream_key")}
+        if bid not in broadcasts:
+            b = found.get(bid)
+            # Beendete Broadcasts vergangener Termine sind normal; tot ist, was fehlt oder vorzeitig beendet wurde
+            if b is None or (b["status"]["lifeCycleStatus"] in DEAD_STATES and record["start"] > now):
+                plan.mark_dead.append(item)
+            continue
+
+        stream = streams.get(broadcasts[bid].get("contentDetails", {}).get("boundStreamId"))
+        if stream is None:
+            plan.rebind.append(dict(item, bind=True))
+            continue
+        fields = _stream_fields(stream)
+        if (fields["stream_url"], fields["stream_key"]) != (record["stream_url"], record["stream_key"]):
+            plan.rebind.append(dict(item, bind=False, stream_url=fields["stream_url"], stream_key=fields["stream_key"]))
+
+    for bid, b in broadcasts.items():
+        if bid in records:
+            continue
+        snippet = b["snippet"]
+        date_str, time_str = from_iso_utc(snippet["scheduledStartTime"])
+        stream = streams.get(b.get("contentDetails", {}).get("boundStreamId"))
+        fields = _stream_fields(stream) if stream else {"stream_url": "", "stream_key": ""}
+        plan.add.append({
+            "date": date_str, "time": time_str, "title": snippet["title"],
+            "location": _location_from_description(snippet.get("description")),
+            "broadcast_id": bid, "stream_url": fields["stream_url"], "stream_key": fields["stream_key"],
+            "bind": stream is None,
+        })
+
+    plan.add.sort(key=lambda item: (item["date"], item["time"]))
+    return plan
+
+def _bind_new_stream(service, item, plan):
+    """Bindet einen Broadcast ohne Stream an den wiederverwendbaren Stream des Orts bzw. einen neuen Stream."""
+    if YOUTUBE_CONFIG.get("reuse_stream", False):
+        stream = get_reusable_stream(service, item["location"])
+    else:
+        stream = _call(service.liveStreams().insert(part="snippet,cdn", body=_stream_body(None)), "liveStreams.insert")
+        plan.api_calls += 1
+    _call(service.liveBroadcasts().bind(part="id,contentDetails", id=item["broadcast_id"], streamId=stream["id"]),
+          "liveBroadcasts.bind")
+    plan.api_calls += 1
+    item.update({k: v for k, v in _stream_fields(stream).items() if k != "stream_id"})
+
+def apply_plan(service, plan):
+    """Führt den Plan aus: zuerst YouTube-Bindungen, dann die Änderungen im Stream-Store, zuletzt neue Einträge."""
+    for item in plan.rebind + plan.add:
+        if item.get("bind"):
+            try:
+                _bind_new_stream(service, item, plan)
+            except Exception as e:
+                log(f"⚠️ Abgleich: Binden von {item['broadcast_id']} fehlgeschlagen: {e}")
+                item["failed"] = True
+
+    changed = 0
+    for item in plan.mark_dead:
+        changed += stream_store.mark_dead(item["broadcast_id"])
+    for item in plan.rebind:
+        if not item.get("failed"):
+            changed += stream_store.update_stream_target(item["broadcast_id"], item["stream_url"], item["stream_key"])
+    if changed:
+        log(f"📝 Abgleich: {changed} Eintrag/Einträge im Stream-Store aktualisiert.")
+
+    for item in plan.add:
+        if item.get("failed"):
+            continue
+        append_stream_to_monthly_xml(StreamInfo(
+            item["date"], item["time"], item["title"], item["location"],
+            item["stream_url"], item["stream_key"], f"https://youtube.com/live/{item['broadcast_id']}"
+        ))
+
+def reconcile(apply=False, notify=True):
+    """
+    Gleicht den Stream-Store (und damit die Monats-XMLs) mit YouTube ab und liefert den Reparaturplan (oder None ohne YouTube-Zugang).
+    apply=False zeigt nur an, was geändert würde (mit notify auch als Telegram-Vorschau).
+    """
+    service = get_authenticated_service()
+    if not service:
+        log("⚠️ YouTube-Abgleich übersprungen – kein gültiger Zugang.")
+        return None
+
+    records = load_local_records()
+    plan = build_plan(service, records)
+    log(f"🔄 YouTube-Abgleich ({len(records)} lokale Einträge): {plan.summary()}")
+    for line in plan.lines():
+        log(f"   {line}")
+
+    if plan.is_empty():
+        return plan
+    if apply:
+        apply_plan(service, plan)
+    if notify and config["telegram"].get("notify_reconcile", True):
+        header = "#Sakristei YouTube-Abgleich" if apply else "#Sakristei YouTube-Abgleich (Vorschau, nichts geändert)"
+        footer = "" if apply else "\nAusführen mit: python reconcile_youtube.py --apply"
+        send_telegram_message(header + "\n" + plan.summary() + "\n" + "\n".join(plan.lines()) + footer)
+    return plan
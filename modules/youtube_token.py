@@ -0,0 +1,97 @@
+import os
+import json
+from datetime import datetime, timedelta, timezone
+import yaml
+from google.oauth2.credentials import Credentials
+from google.auth.transport.requests import Request
+
+from utils.logger import log
+from utils.file_lock import file_lock, replace_file, write_atomic
+
+# === Basis & Konfiguration ===
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(BASE_DIR, ".."))
+with open(os.path.join(ROOT_DIR, "config.yaml"), "r", encoding="utf-8") as f:
+    config = yaml.safe_load(f)
+YOUTUBE_CONFIG = config.get("youtube", {})
+
+SCOPES = ['https://www.googleapis.com/auth/youtube.force-ssl']
+TOKEN_PATH = os.path.join(ROOT_DIR, "secrets", "token.json")
+LOCK_PATH = TOKEN_PATH + ".lock"
+REFRESH_AHEAD = timedelta(minutes=int(YOUTUBE_CONFIG.get("token_refresh_ahead_minutes", 5)))
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)   # google-auth rechnet mit naiver UTC-Zeit
+
+def _needs_refresh(creds):
+    return not creds.token or creds.expiry is None or creds.expiry - _utcnow() < REFRESH_AHEAD
+
+class SharedCredentials(Credentials):
+    """
+    Credentials, deren Refresh (auch der automatische von google-auth vor einem Aufruf) prozessübergreifend
+    nur einmal stattfindet: unter der Token-Sperre wird zuerst token.json neu gelesen – hat ein anderer
+    Prozess schon erneuert, wird dessen Access Token ohne eigenen Round-Trip übernommen.
+    """
+
+    def refresh(self, request):
+        with file_lock(LOCK_PATH, timeout=60):
+            stored = _read()
+            if stored is not None and stored.refresh_token != self.refresh_token:
+                # Inzwischen neu autorisiert (Token-Tool) – neue Zugangsdaten übernehmen statt die neue
+                # token.json mit dem alten, evtl. widerrufenen refresh_token zu überschreiben
+                self._refresh_token = stored.refresh_token
+                self._client_id = stored.client_id
+                self._client_secret = stored.client_secret
+                self.token = stored.token
+                self.expiry = stored.expiry
+                if not _needs_refresh(stored):
+                    log("🔁 Neu autorisiertes Token aus token.json übernommen.")
+                    return
+            elif stored is not None and not _needs_refresh(stored):
+                self.token = stored.token
+                self.expiry = stored.expiry
+                return
+            super().refresh(request)
+            _write(self)
+            log("🔁 Access Token erfolgreich mit refresh_token erneuert.")
+
+def _read():
+    try:
+        with open(TOKEN_PATH, "r", encoding="utf-8") as f:
+            info = json.load(f)
+    except FileNotFoundError:
+        return None
+    return SharedCredentials.from_authorized_user_info(info, SCOPES)
+
+def _write(creds):
+    write_atomic(TOKEN_PATH, creds.to_json().encode("utf-8"))
+
+def save_credentials(creds):
+    """Schreibt token.json atomar (temporäre Datei + os.replace) unter der Token-Sperre."""
+    with file_lock(LOCK_PATH, timeout=60):
+        _write(creds)
+
+def get_credentials():
+    """
+    Liefert Credentials aus token.json und erneuert sie, sobald sie in weniger als REFRESH_AHEAD
+    ablaufen – unter Sperre, damit genau ein Prozess den Refresh macht. None ohne token.json.
+    Fehler beim Refresh (z. B. invalid_grant) werden weitergereicht.
+    """
+    try:
+        creds = _read()
+    except Exception as e:
+        log(f"⚠️ Fehler beim Laden des gespeicherten Tokens: {e}")
+        return None
+    if creds is None or not creds.refresh_token or not _needs_refresh(creds):
+        return creds
+    creds.refresh(Request())
+    return creds
+
+def quarantine():
+    """Legt ein ungültiges token.json beiseite (umbenennen statt löschen, damit kein Leser eine halbe Datei sieht)."""
+    target = f"{TOKEN_PATH}.invalid-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    with file_lock(LOCK_PATH, timeout=60):
+        if os.path.exists(TOKEN_PATH):
+            replace_file(TOKEN_PATH, target)
+            return target
+    return None
@@ -0,0 +1,21 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+import argparse
+from modules.youtube_reconcile import reconcile
+from utils.logger import log
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monats-XML und YouTube-Broadcasts abgleichen")
+    parser.add_argument("--apply", action="store_true", help="Reparaturplan ausführen (ohne: nur anzeigen)")
+    args = parser.parse_args()
+
+    plan = reconcile(apply=args.apply, notify=args.apply)
+    if plan is None:
+        sys.exit(1)
+    print(plan.summary())
+    for line in plan.lines():
+        print(line)
+    if not args.apply and not plan.is_empty():
+        print("ℹ️ Nur Vorschau – mit --apply ausführen.")
+    log("✅ YouTube-Abgleich beendet.")
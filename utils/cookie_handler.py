@@ -1,20 +1,73 @@
-import time
-import pyautogui
-
-def handle_cookie_banner(driver):
-    try:
-        script = """
-            const btn = document.querySelector('button[data-testid="uc-accept-all-button"]');
-            if (btn) { btn.click(); return true; } else { return false; }
-        """
-        result = driver.execute_script(script)
-        if result:
-            return
-    except:
-        pass
-
-    time.sleep(2)
-    for _ in range(6):
-        pyautogui.press('tab')
-        time.sleep(0.2)
-    pyautogui.press('enter')
+import time
+from utils.logger import log
+
+# Sucht den Usercentrics-Button auch in (offenen) Shadow-DOMs, z. B. unter #usercentrics-root
+FIND_ACCEPT_BUTTON = """
+    const selector = 'button[data-testid="uc-accept-all-button"]';
+    function find(root) {
+        const hit = root.querySelector(selector);
+        if (hit) { return hit; }
+        for (const el of root.querySelectorAll('*')) {
+            if (el.shadowRoot) {
+                const inner = find(el.shadowRoot);
+                if (inner) { return inner; }
+            }
+        }
+        return null;
+    }
+"""
+
+ACCEPT_SCRIPT = FIND_ACCEPT_BUTTON + """
+    const btn = find(document);
+    if (btn) { btn.click(); return true; }
+    if (window.UC_UI && typeof window.UC_UI.acceptAllConsents === 'function' && window.UC_UI.isInitialized && window.UC_UI.isInitialized()) {
+        window.UC_UI.acceptAllConsents();
+        if (typeof window.UC_UI.closeCMP === 'function') { window.UC_UI.closeCMP(); }
+        return true;
+    }
+    return false;
+"""
+
+CONSENT_VISIBLE_SCRIPT = FIND_ACCEPT_BUTTON + """
+    return !!find(document);
+"""
+
+def click_accept_button(driver):
+    """Klickt "Alle akzeptieren" (DOM inkl. Shadow-DOM oder Usercentrics-API), ohne Wartezeit."""
+    try:
+        return bool(driver.execute_script(ACCEPT_SCRIPT))
+    except:
+        return False
+
+def is_consent_visible(driver):
+    try:
+        return bool(driver.execute_script(CONSENT_VISIBLE_SCRIPT))
+    except:
+        return False
+
+def seed_consent_cookies(driver, cookies):
+    """
+    Setzt vorab hinterlegte Consent-Cookies per DevTools, noch bevor die Seite geladen wird
+    (cookies: Liste von Dicts mit name, value, domain und optional path).
+    """
+    for cookie in cookies or []:
+        try:
+            driver.execute_cdp_cmd("Network.setCookie", {
+                "name": cookie["name"],
+                "value": str(cookie["value"]),
+                "domain": cookie["domain"],
+                "path": cookie.get("path", "/"),
+                "secure": True,
+            })
+        except Exception as e:
+            log(f"⚠️ Consent-Cookie {cookie.get('name')} konnte nicht gesetzt werden: {e}")
+
+def handle_cookie_banner(driver, timeout=2):
+    """Bestätigt das Cookie-Banner rein über das DOM – funktioniert auch headless und ohne Desktop."""
+    deadline = time.monotonic() + timeout
+    while True:
+        if click_accept_button(driver):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.2)
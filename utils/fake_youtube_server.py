@@ -0,0 +1,397 @@
+"""
+Skript: fake_youtube_server.py
+Zweck: Lokaler Ersatz für die YouTube Data API v3 (nur die im Projekt genutzten Aufrufe) mit
+       In-Memory-Zustand, einstellbarer Latenz, Fehlerinjektion und Quota-Zählung – für Tests,
+       Benchmarks und das Nachstellen von Fehlerfällen ohne Google-Konto.
+
+Unterstützt:
+    liveBroadcasts  list / insert / bind / delete
+    liveStreams     list / insert / delete
+    videos          list / delete
+    channels        list (mine, Uploads-Playlist)
+    playlistItems   list (Uploads-Playlist)
+    search          list (forMine, type=video)
+    Batch-Requests  POST /batch/youtube/v3 (multipart/mixed)
+    GET /__stats    Zustand, Aufrufzähler und verbrauchte Quota als JSON
+    POST /__reset   Zustand leeren
+
+Aufruf:
+    python utils/fake_youtube_server.py --port 8765 --latency 150
+    python utils/fake_youtube_server.py --error-rate 0.05 --fail liveBroadcasts.bind=503x2
+    python utils/fake_youtube_server.py --quota-limit 500 --seed-videos 20
+
+In config.yaml darauf umstellen:
+    youtube:
+      api_endpoint: http://127.0.0.1:8765/
+      anonymous_credentials: true
+"""
+
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import json
+import time
+import random
+import argparse
+import threading
+from datetime import datetime, timedelta, timezone
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from modules.youtube_quota import QUOTA_COSTS
+
+UPLOADS_PLAYLIST = "UUfake"
+
+class ApiError(Exception):
+    def __init__(self, status, reason, message=""):
+        super().__init__(message or reason)
+        self.status = status
+        self.reason = reason
+
+    def body(self):
+        return {"error": {"code": self.status, "message": str(self), "errors": [
+            {"reason": self.reason, "domain": "youtube.fake", "message": str(self)}
+        ]}}
+
+def _now():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+def parse_fail_rule(spec):
+    """"liveBroadcasts.bind=503:backendError x2" → (Methode, Status, Grund, Anzahl oder None = immer)."""
+    method, _, rule = spec.partition("=")
+    head, _, times = rule.rpartition("x")
+    if head and times.strip().isdigit():   # "x" kann auch im Grund stehen (rateLimitExceeded)
+        rule = head
+    else:
+        times = ""
+    status, _, reason = rule.partition(":")
+    status = int(status)
+    reason = reason.strip()
+    default_reason = {403: "rateLimitExceeded", 404: "notFound", 429: "rateLimitExceeded"}.get(status, "backendError")
+    return method.strip(), status, reason or default_reason, int(times) if times else None
+
+class FakeYouTube:
+    """In-Memory-Zustand samt Quota und Fehlerinjektion; alle Zugriffe laufen unter einer Sperre."""
+
+    def __init__(self, latency_ms=0, error_rate=0.0, error_status=503, fail_rules=None, quota_limit=None, seed_videos=0):
+        self.latency = latency_ms / 1000
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.fail_spec = list(fail_rules or [])
+        self.quota_limit = quota_limit
+        self.seed_videos = seed_videos
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.next_id = 1
+            self.broadcasts = {}
+            self.streams = {}
+            self.videos = {}
+            self.calls = {}
+            self.errors = {}
+            self.quota_used = 0
+            self.http_requests = 0
+            self.fail_rules = {method: [status, reason, times] for method, status, reason, times in self.fail_spec}
+            for i in range(self.seed_videos):
+                published = datetime.now(timezone.utc) - timedelta(days=i + 1)
+                self._add_video(f"Archivierter Gottesdienst {i + 1}", published.strftime("%Y-%m-%dT%H:%M:%SZ"))
+
+    def stats(self):
+        with self.lock:
+            return {
+                "quota_used": self.quota_used,
+                "quota_limit": self.quota_limit,
+                "http_requests": self.http_requests,
+                "calls": dict(self.calls),
+                "errors": dict(self.errors),
+                "broadcasts": len(self.broadcasts),
+                "streams": len(self.streams),
+                "videos": len(self.videos),
+            }
+
+    def _new_id(self, prefix):
+        new_id = f"{prefix}{self.next_id:06d}"
+        self.next_id += 1
+        return new_id
+
+    def _add_video(self, title, published_at, live_content="none"):
+        video_id = self._new_id("v")
+        self.videos[video_id] = {"id": video_id, "snippet": {
+            "title": title, "publishedAt": published_at, "liveBroadcastContent": live_content
+        }}
+        return video_id
+
+    # === Abrechnung & Fehlerinjektion ===
+
+    def _charge(self, method):
+        self.calls[method] = self.calls.get(method, 0) + 1
+        rule = self.fail_rules.get(method)
+        error = None
+        if rule and rule[2] != 0:
+            if rule[2] is not None:
+                rule[2] -= 1
+            error = ApiError(rule[0], rule[1], f"Injizierter Fehler für {method}")
+        elif self.error_rate and random.random() < self.error_rate:
+            error = ApiError(self.error_status, "backendError", f"Zufälliger Fehler für {method}")
+        elif self.quota_limit is not None and self.quota_used + QUOTA_COSTS.get(method, 1) > self.quota_limit:
+            error = ApiError(403, "quotaExceeded", "The request cannot be completed because you have exceeded your quota.")
+        if error:
+            self.errors[method] = self.errors.get(method, 0) + 1
+            raise error
+        self.quota_used += QUOTA_COSTS.get(method, 1)
+
+    # === API ===
+
+    def handle(self, verb, path, query, body):
+        """Ein einzelner API-Aufruf → (Status, JSON oder None). Wirft ApiError."""
+        routes = {
+            ("GET", "/youtube/v3/liveBroadcasts"): ("liveBroadcasts.list", self.list_broadcasts),
+            ("POST", "/youtube/v3/liveBroadcasts"): ("liveBroadcasts.insert", self.insert_broadcast),
+            ("POST", "/youtube/v3/liveBroadcasts/bind"): ("liveBroadcasts.bind", self.bind_broadcast),
+            ("DELETE", "/youtube/v3/liveBroadcasts"): ("liveBroadcasts.delete", self.delete_broadcast),
+            ("GET", "/youtube/v3/liveStreams"): ("liveStreams.list", self.list_streams),
+            ("POST", "/youtube/v3/liveStreams"): ("liveStreams.insert", self.insert_stream),
+            ("DELETE", "/youtube/v3/liveStreams"): ("liveStreams.delete", self.delete_stream),
+            ("GET", "/youtube/v3/videos"): ("videos.list", self.list_videos),
+            ("DELETE", "/youtube/v3/videos"): ("videos.delete", self.delete_video),
+            ("GET", "/youtube/v3/channels"): ("channels.list", self.list_channels),
+            ("GET", "/youtube/v3/playlistItems"): ("playlistItems.list", self.list_playlist_items),
+            ("GET", "/youtube/v3/search"): ("search.list", self.search),
+        }
+        if (verb, path) not in routes:
+            raise ApiError(404, "notFound", f"{verb} {path} wird vom Fake-Server nicht unterstützt")
+        method, handler = routes[(verb, path)]
+        with self.lock:
+            self._charge(method)
+            return handler(query, body)
+
+    def _page(self, items, query, default_size=5):
+        size = min(int(query.get("maxResults", default_size)), 50)
+        offset = int(query.get("pageToken") or 0)
+        page = {"items": items[offset:offset + size], "pageInfo": {"totalResults": len(items), "resultsPerPage": size}}
+        if offset + size < len(items):
+            page["nextPageToken"] = str(offset + size)
+        return 200, page
+
+    def _ids(self, query):
+        return [i for i in query.get("id", "").split(",") if i]
+
+    def list_broadcasts(self, query, body):
+        items = list(self.broadcasts.values())
+        if query.get("id"):
+            items = [self.broadcasts[i] for i in self._ids(query) if i in self.broadcasts]
+        status = query.get("broadcastStatus")
+        if status == "upcoming":
+            items = [b for b in items if b["status"]["lifeCycleStatus"] in ("created", "ready")]
+        elif status == "active":
+            items = [b for b in items if b["status"]["lifeCycleStatus"] in ("live", "testing")]
+        elif status == "completed":
+            items = [b for b in items if b["status"]["lifeCycleStatus"] == "complete"]
+        items.sort(key=lambda b: b["snippet"].get("scheduledStartTime", ""))
+        return self._page(items, query)
+
+    def insert_broadcast(self, query, body):
+        if not body or not body.get("snippet", {}).get("title"):
+            raise ApiError(400, "invalidTitle", "Titel fehlt")
+        broadcast_id = self._add_video(body["snippet"]["title"], _now(), live_content="upcoming")
+        broadcast = {
+            "id": broadcast_id,
+            "snippet": dict(body["snippet"], publishedAt=_now()),
+            "status": dict(body.get("status", {}), lifeCycleStatus="created"),
+            "contentDetails": dict(body.get("contentDetails", {})),
+        }
+        self.broadcasts[broadcast_id] = broadcast
+        return 200, broadcast
+
+    def bind_broadcast(self, query, body):
+        broadcast = self.broadcasts.get(query.get("id"))
+        if broadcast is None:
+            raise ApiError(404, "liveBroadcastNotFound", "Broadcast nicht gefunden")
+        if query.get("streamId") not in self.streams:
+            raise ApiError(404, "liveStreamNotFound", "Stream nicht gefunden")
+        broadcast["contentDetails"]["boundStreamId"] = query["streamId"]
+        broadcast["status"]["lifeCycleStatus"] = "ready"
+        return 200, broadcast
+
+    def delete_broadcast(self, query, body):
+        if self.broadcasts.pop(query.get("id"), None) is None:
+            raise ApiError(404, "liveBroadcastNotFound", "Broadcast nicht gefunden")
+        self.videos.pop(query["id"], None)
+        return 204, None
+
+    def list_streams(self, query, body):
+        items = list(self.streams.values())
+        if query.get("id"):
+            items = [self.streams[i] for i in self._ids(query) if i in self.streams]
+        return self._page(items, query)
+
+    def insert_stream(self, query, body):
+        stream_id = self._new_id("s")
+        stream = {
+            "id": stream_id,
+            "snippet": dict((body or {}).get("snippet", {})),
+            "cdn": dict((body or {}).get("cdn", {}), ingestionInfo={
+                "ingestionAddress": "rtmp://127.0.0.1/live2",
+                "streamName": f"fake-{stream_id}",
+            }),
+            "contentDetails": {"isReusable": (body or {}).get("contentDetails", {}).get("isReusable", True)},
+        }
+        self.streams[stream_id] = stream
+        return 200, stream
+
+    def delete_stream(self, query, body):
+        if self.streams.pop(query.get("id"), None) is None:
+            raise ApiError(404, "liveStreamNotFound", "Stream nicht gefunden")
+        return 204, None
+
+    def delete_video(self, query, body):
+        if self.videos.pop(query.get("id"), None) is None:
+            raise ApiError(404, "videoNotFound", "Video nicht gefunden")
+        self.broadcasts.pop(query["id"], None)
+        return 204, None
+
+    def list_videos(self, query, body):
+        return self._page([self.videos[i] for i in self._ids(query) if i in self.videos], query)
+
+    def list_channels(self, query, body):
+        return 200, {"items": [{"id": "UCfake", "contentDetails": {"relatedPlaylists": {"uploads": UPLOADS_PLAYLIST}}}]}
+
+    def list_playlist_items(self, query, body):
+        if query.get("playlistId") != UPLOADS_PLAYLIST:
+            raise ApiError(404, "playlistNotFound", "Playlist nicht gefunden")
+        items = sorted(self.videos.values(), key=lambda v: v["snippet"]["publishedAt"], reverse=True)
+        return self._page([{
+            "id": f"pi-{v['id']}",
+            "snippet": {"title": v["snippet"]["title"], "publishedAt": v["snippet"]["publishedAt"]},
+            "contentDetails": {"videoId": v["id"], "videoPublishedAt": v["snippet"]["publishedAt"]},
+        } for v in items], query)
+
+    def search(self, query, body):
+        items = sorted(self.videos.values(), key=lambda v: v["snippet"]["publishedAt"], reverse=True)
+        return self._page([{"id": {"kind": "youtube#video", "videoId": v["id"]}, "snippet": v["snippet"]} for v in items], query)
+
+def _split_target(target):
+    parts = urlsplit(target)
+    query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+    return parts.path, query
+
+def _json_body(raw):
+    return json.loads(raw) if raw and raw.strip() else None
+
+class Handler(BaseHTTPRequestHandler):
+    api = None            # FakeYouTube, vom Server gesetzt
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload, content_type="application/json; charset=UTF-8"):
+        data = b"" if payload is None else payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _dispatch(self, verb):
+        raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        path, query = _split_target(self.path)
+        with self.api.lock:
+            self.api.http_requests += 1
+
+        if path == "/__stats":
+            return self._send(200, self.api.stats())
+        if path == "/__reset":
+            self.api.reset()
+            return self._send(200, {"reset": True})
+
+        time.sleep(self.api.latency)
+        if path == "/batch/youtube/v3":
+            return self._batch(raw)
+        try:
+            status, payload = self.api.handle(verb, path, query, _json_body(raw))
+        except ApiError as e:
+            status, payload = e.status, e.body()
+        self._send(status, payload)
+
+    def _batch(self, raw):
+        """multipart/mixed wie von googleapiclient.http.BatchHttpRequest erzeugt und erwartet."""
+        message = BytesParser(policy=HTTP).parsebytes(
+            f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode() + raw
+        )
+        boundary = "batch_fake_youtube"
+        out = []
+        for part in message.iter_parts():
+            content_id = part["Content-ID"] or ""
+            inner = part.get_payload(decode=True).decode("utf-8")
+            head, _, body = inner.replace("\r\n", "\n").partition("\n\n")
+            verb, target = head.split("\n")[0].split(" ")[:2]
+            path, query = _split_target(target)
+            try:
+                status, payload = self.api.handle(verb, path, query, _json_body(body))
+            except ApiError as e:
+                status, payload = e.status, e.body()
+            text = "" if payload is None else json.dumps(payload)
+            response_id = content_id.replace("<", "<response-", 1)
+            out.append(
+                f"--{boundary}\r\nContent-Type: application/http\r\nContent-ID: {response_id}\r\n\r\n"
+                f"HTTP/1.1 {status} {self.responses.get(status, ('',))[0]}\r\n"
+                f"Content-Type: application/json; charset=UTF-8\r\n\r\n{text}\r\n"
+            )
+        out.append(f"--{boundary}--\r\n")
+        self._send(200, "".join(out).encode("utf-8"), content_type=f"multipart/mixed; boundary={boundary}")
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+def start_server(api, host="127.0.0.1", port=0):
+    """Startet den Server im Hintergrund-Thread; liefert (Server, Basis-URL). port=0 wählt einen freien Port."""
+    handler = type("BoundHandler", (Handler,), {"api": api})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/"
+
+def main():
+    parser = argparse.ArgumentParser(description="Lokaler Fake-Server für die YouTube Data API v3")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0, help="Verzögerung je HTTP-Request in ms (Batch zählt einmal)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Anteil zufällig fehlschlagender Aufrufe (0–1)")
+    parser.add_argument("--error-status", type=int, default=503, help="HTTP-Status der zufälligen Fehler")
+    parser.add_argument("--fail", action="append", default=[], metavar="METHODE=STATUS[:GRUND][xN]",
+                        help="z. B. liveBroadcasts.bind=503x2 oder liveStreams.insert=403:rateLimitExceeded")
+    parser.add_argument("--quota-limit", type=int, default=None, help="Danach antwortet der Server mit 403 quotaExceeded")
+    parser.add_argument("--seed-videos", type=int, default=0, help="Archivierte Videos für search.list/videos.delete anlegen")
+    args = parser.parse_args()
+
+    api = FakeYouTube(
+        latency_ms=args.latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        fail_rules=[parse_fail_rule(spec) for spec in args.fail],
+        quota_limit=args.quota_limit,
+        seed_videos=args.seed_videos,
+    )
+    server, url = start_server(api, args.host, args.port)
+    print(f"🧪 Fake-YouTube-API läuft auf {url} (Statistik: {url}__stats) – Strg+C beendet.")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(f"📊 {json.dumps(api.stats(), ensure_ascii=False)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import os
+import time
+import threading
+from contextlib import contextmanager
+
+try:
+    import msvcrt  # Windows
+except ImportError:
+    msvcrt = None
+    import fcntl
+
+def _try_lock(f):
+    if msvcrt:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+def _unlock(f):
+    if msvcrt:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+@contextmanager
+def file_lock(lock_path, timeout=30):
+    """
+    Prozessübergreifende (beratende) Sperre über eine Lock-Datei – wirkt auch zwischen
+    Threads, da jeder Aufruf ein eigenes Dateihandle öffnet. Wirft TimeoutError nach timeout Sekunden.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(lock_path)), exist_ok=True)
+    f = open(lock_path, "a+")
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _try_lock(f)
+            break
+        except OSError:
+            if time.monotonic() >= deadline:
+                f.close()
+                raise TimeoutError(f"Sperre nicht erhalten: {lock_path}")
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        try:
+            _unlock(f)
+        finally:
+            f.close()
+
+def replace_file(src, dst, attempts=10):
+    """os.replace mit Wiederholung – unter Windows schlägt es fehl, solange ein anderer Prozess die Zieldatei gerade liest."""
+    for attempt in range(attempts):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if attempt + 1 >= attempts:
+                raise
+            time.sleep(0.05 * (attempt + 1))
+
+def write_atomic(path, data: bytes):
+    """
+    Schreibt über eine temporäre Datei im selben Verzeichnis und ersetzt das Ziel atomar:
+    Leser sehen immer die alte oder die neue, nie eine halbe Datei.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        replace_file(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,198 @@
+"""
+Skript: web_parser_benchmark.py
+Zweck: Spielt die gespeicherten Gottesdienst-Seiten aus fixtures/web_parser/ offline durch
+       den Parser von modules/web_parser.py, prüft das Ergebnis gegen cases.json und misst
+       die geparsten Termine pro Sekunde je Extraktions-Engine.
+
+Aufruf:
+    python utils/web_parser_benchmark.py                      # nur HTTP-Engine (BeautifulSoup)
+    python utils/web_parser_benchmark.py --engines http,selenium --iterations 50
+    python utils/web_parser_benchmark.py --capture normal_day.html --start 2026-10-18 --end 2026-10-18
+
+--capture speichert die echte Antwort der Pfarreiseite bereinigt (ohne Skripte, Formulare, Tracking,
+E-Mail-Adressen und Telefonnummern) als Fixture und gibt den passenden Eintrag für cases.json aus.
+Fälle mit "source": "synthetic" sind nachgebaute Seiten und sollten so ersetzt werden.
+
+Die Selenium-Engine lädt die Dateien per file:// in die Browser-Sitzung und braucht ein
+installiertes Chrome; ist keins vorhanden, wird sie übersprungen.
+"""
+
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import re
+import json
+import time
+import argparse
+from datetime import datetime
+
+import requests
+from bs4 import BeautifulSoup, Comment
+
+import modules.web_parser as web_parser
+from modules.event_filter import EventFilter
+from modules.browser_session import close_browser_session, get_browser_session
+
+FIXTURE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "fixtures", "web_parser"))
+
+def _entries_http(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return web_parser.parse_entries_html(f.read()) or []
+
+def _entries_selenium(path):
+    entries = web_parser._fetch_entries_selenium("file:///" + path.replace(os.sep, "/").lstrip("/"))
+    if entries is None:
+        raise RuntimeError("Seite konnte nicht geladen werden")
+    return entries
+
+ENGINES = {
+    "http": _entries_http,
+    "selenium": _entries_selenium,
+}
+
+SCRUB_TAGS = ["script", "style", "noscript", "iframe", "svg", "link", "form", "input", "button", "img"]
+KEEP_ATTRS = {"class", "lang", "charset"}
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE_RE = re.compile(r"(?:\+49|\b0)\d[\d /-]{5,}\d")
+
+def scrub_html(html):
+    """Echte Seite auf das Markup reduzieren, das der Parser sieht – ohne Skripte, Tracking und Kontaktdaten."""
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup.find_all(SCRUB_TAGS):
+        tag.decompose()
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
+    for meta in soup.find_all("meta"):
+        if not meta.has_attr("charset"):
+            meta.decompose()
+    for tag in soup.find_all(True):
+        tag.attrs = {key: value for key, value in tag.attrs.items() if key in KEEP_ATTRS}
+    for text in soup.find_all(string=True):
+        scrubbed = PHONE_RE.sub("0000 000000", EMAIL_RE.sub("kontakt@example.org", text))
+        if scrubbed != text:
+            text.replace_with(scrubbed)
+    return str(soup)
+
+def capture(name, start_str, end_str, church_id, keywords):
+    """Echte Antwort für den Zeitraum holen (HTTP, sonst Selenium), bereinigt speichern, cases.json-Eintrag ausgeben."""
+    url = web_parser._build_url(start_str, end_str, church_id)
+    html = None
+    try:
+        response = requests.get(url, headers=web_parser.HTTP_HEADERS, timeout=20)
+        response.raise_for_status()
+        html = response.text
+    except Exception as e:
+        print(f"⚠️ HTTP-Abruf fehlgeschlagen: {e}")
+    if html is None or web_parser.parse_entries_html(html) is None:
+        print("ℹ️ Kein Gottesdienst-Markup per HTTP – lade die Seite über Selenium.")
+        with get_browser_session().page(url) as driver:
+            html = driver.page_source
+
+    html = scrub_html(html)
+    with open(os.path.join(FIXTURE_DIR, name), "w", encoding="utf-8") as f:
+        f.write(html)
+
+    entries = web_parser.parse_entries_html(html) or []
+    web_parser.EVENT_FILTER = EventFilter.from_config({"keywords": keywords})
+    events = web_parser._events_from_entries(entries, datetime.strptime(start_str, "%Y-%m-%d"),
+                                             datetime.strptime(end_str, "%Y-%m-%d"))
+    case = {"file": name, "source": url, "start": start_str, "end": end_str,
+            "entries": len(entries), "events": _event_dicts(events)}
+    print(f"💾 {name} gespeichert ({len(entries)} Einträge). Eintrag für cases.json – Termine bitte prüfen:")
+    print(json.dumps(case, ensure_ascii=False, indent=2))
+
+def _event_dicts(events):
+    return [{"date": e.date, "time": e.time, "title": e.title, "location": e.location} for e in events]
+
+def run_case(engine, case):
+    path = os.path.join(FIXTURE_DIR, case["file"])
+    start = datetime.strptime(case["start"], "%Y-%m-%d")
+    end = datetime.strptime(case["end"], "%Y-%m-%d")
+
+    entries = ENGINES[engine](path)
+    events = web_parser._events_from_entries(entries, start, end)
+
+    errors = []
+    if len(entries) != case["entries"]:
+        errors.append(f"{len(entries)} Einträge statt {case['entries']}")
+    if _event_dicts(events) != case["events"]:
+        errors.append(f"Termine weichen ab: {_event_dicts(events)}")
+    return entries, errors
+
+def benchmark(engine, cases, iterations):
+    started = time.perf_counter()
+    parsed = 0
+    for _ in range(iterations):
+        for case in cases:
+            path = os.path.join(FIXTURE_DIR, case["file"])
+            start = datetime.strptime(case["start"], "%Y-%m-%d")
+            end = datetime.strptime(case["end"], "%Y-%m-%d")
+            parsed += len(web_parser._events_from_entries(ENGINES[engine](path), start, end))
+    elapsed = time.perf_counter() - started
+    return parsed, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay- und Benchmark-Harness für web_parser")
+    parser.add_argument("--engines", default="http", help="Kommagetrennt: http, selenium")
+    parser.add_argument("--iterations", type=int, default=200, help="Durchläufe über alle Fixtures je Engine")
+    parser.add_argument("--capture", metavar="DATEI", help="Echte Seite als Fixture unter diesem Namen speichern")
+    parser.add_argument("--start", help="Startdatum für --capture (YYYY-MM-DD)")
+    parser.add_argument("--end", help="Enddatum für --capture (YYYY-MM-DD, Standard: --start)")
+    parser.add_argument("--church", help="Kirchen-ID für --capture (Standard: web.church_id)")
+    args = parser.parse_args()
+
+    with open(os.path.join(FIXTURE_DIR, "cases.json"), "r", encoding="utf-8") as f:
+        spec = json.load(f)
+    cases = spec["cases"]
+
+    if args.capture:
+        if not args.start:
+            parser.error("--capture braucht --start")
+        try:
+            capture(args.capture, args.start, args.end or args.start,
+                    args.church or web_parser._church_ids()[0], spec["keywords"])
+        finally:
+            close_browser_session()
+        return
+
+    synthetic = [case["file"] for case in cases if case.get("source") == "synthetic"]
+    if synthetic:
+        print(f"⚠️ Nachgebaute Fixtures (mit --capture durch echte Seiten ersetzen): {', '.join(synthetic)}")
+
+    # Feste Stichwörter statt config.yaml, damit das Ergebnis reproduzierbar bleibt;
+    # das Logging je Eintrag würde die Messung verfälschen und wird abgeschaltet.
+    web_parser.EVENT_FILTER = EventFilter.from_config({"keywords": spec["keywords"]})
+    web_parser.log = lambda message: None
+
+    failed = False
+    try:
+        for engine in [e.strip() for e in args.engines.split(",") if e.strip()]:
+            if engine not in ENGINES:
+                print(f"❓ Unbekannte Engine: {engine}")
+                failed = True
+                continue
+
+            print(f"\n🔧 Engine: {engine}")
+            try:
+                for case in cases:
+                    entries, errors = run_case(engine, case)
+                    if errors:
+                        failed = True
+                        print(f"❌ {case['file']}: " + "; ".join(errors))
+                    else:
+                        print(f"✅ {case['file']}: {len(entries)} Einträge, {len(case['events'])} Termine")
+            except Exception as e:
+                print(f"⚠️ Engine {engine} nicht verfügbar, übersprungen: {e}")
+                continue
+
+            iterations = args.iterations if engine == "http" else max(1, args.iterations // 20)
+            parsed, elapsed = benchmark(engine, cases, iterations)
+            print(f"⏱️ {parsed} Termine in {elapsed:.3f} s → {parsed / elapsed:,.0f} Termine/s ({iterations} Durchläufe)")
+    finally:
+        close_browser_session()
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
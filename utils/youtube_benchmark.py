@@ -0,0 +1,94 @@
+"""
+Skript: youtube_benchmark.py
+Zweck: Misst den Planungsdurchsatz von modules/youtube_manager.create_streams je Anlage-Modus
+       offline gegen utils/fake_youtube_server.py (eigener Server im Prozess, freier Port) und
+       zeigt HTTP-Requests, API-Aufrufe und verbrauchte Quota des Fake-Servers.
+
+Aufruf:
+    python utils/youtube_benchmark.py                                  # 12 Termine, alle Modi, 150 ms Latenz
+    python utils/youtube_benchmark.py --events 40 --latency 300 --modes batch,concurrent
+    python utils/youtube_benchmark.py --fail liveBroadcasts.bind=503x3  # Wiederholung/Rückbau nachstellen
+
+Journal, Quota-Ledger und Ausgaben landen in einem temporären Verzeichnis; secrets/ und status/
+bleiben unberührt.
+"""
+
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import json
+import time
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+
+from utils.fake_youtube_server import FakeYouTube, start_server, parse_fail_rule
+import modules.youtube_client as youtube_client
+import modules.youtube_quota as youtube_quota
+import modules.youtube_manager as youtube_manager
+from modules.web_parser import Event
+
+MODES = ["sequential", "batch", "concurrent"]
+
+def synthetic_events(count):
+    start = datetime.now() + timedelta(days=1)
+    return [
+        Event((start + timedelta(days=i // 3)).strftime("%Y-%m-%d"), ["09:30", "11:00", "18:30"][i % 3],
+              f"Benchmark-Gottesdienst {i + 1}", "St. Benchmark")
+        for i in range(count)
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description="Planungs-Benchmark gegen die Fake-YouTube-API")
+    parser.add_argument("--events", type=int, default=12)
+    parser.add_argument("--modes", default=",".join(MODES), help="Kommagetrennt: " + ", ".join(MODES))
+    parser.add_argument("--latency", type=float, default=150, help="Latenz je HTTP-Request in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--fail", action="append", default=[], metavar="METHODE=STATUS[:GRUND][xN]")
+    parser.add_argument("--workers", type=int, default=4, help="youtube.max_workers für den Modus concurrent")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="yt_bench_")
+    api = FakeYouTube(latency_ms=args.latency, error_rate=args.error_rate,
+                      fail_rules=[parse_fail_rule(spec) for spec in args.fail])
+    server, url = start_server(api)
+
+    # Auf den Fake-Server umlenken, Zustandsdateien ins Temp-Verzeichnis, ohne Telegram/XML
+    youtube_client.API_ENDPOINT = url
+    youtube_client.ANONYMOUS = True
+    youtube_client.invalidate()
+    youtube_quota.LEDGER_PATH = os.path.join(workdir, "quota.json")
+    youtube_quota.LOCK_PATH = youtube_quota.LEDGER_PATH + ".lock"
+    youtube_manager.JOURNAL_PATH = os.path.join(workdir, "journal.json")
+    youtube_manager.REUSABLE_STREAMS_PATH = os.path.join(workdir, "streams.json")
+    youtube_manager.stream_exists_in_xml = lambda event: False
+    youtube_manager.send_telegram_message = lambda *a, **k: None
+    youtube_manager.log = lambda message: None
+    youtube_manager.YOUTUBE_CONFIG["max_workers"] = args.workers
+
+    events = synthetic_events(args.events)
+    print(f"🧪 Fake-API {url} – {len(events)} Termine, {args.latency:.0f} ms Latenz je Request")
+    try:
+        for mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+            if mode not in MODES:
+                print(f"❓ Unbekannter Modus: {mode}")
+                continue
+            api.reset()
+            youtube_manager.YOUTUBE_CONFIG["create_mode"] = mode
+            if os.path.exists(youtube_manager.JOURNAL_PATH):
+                os.remove(youtube_manager.JOURNAL_PATH)
+
+            started = time.perf_counter()
+            infos = youtube_manager.create_streams(events, output_dir=workdir)
+            elapsed = time.perf_counter() - started
+            stats = api.stats()
+            print(f"\n🔧 {mode}: {len(infos)}/{len(events)} angelegt in {elapsed:.2f} s "
+                  f"→ {len(infos) / elapsed:.1f} Termine/s")
+            print(f"   {stats['http_requests']} HTTP-Requests, {sum(stats['calls'].values())} API-Aufrufe, "
+                  f"{stats['quota_used']} Quota-Einheiten, Fehler: {json.dumps(stats['errors'])}")
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
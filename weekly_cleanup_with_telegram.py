@@ -1,71 +1,124 @@
-import os
+import argparse
 from datetime import datetime, timedelta, timezone
-from googleapiclient.discovery import build
-from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
 from utils.logger import log
 from modules.telegram_sender import send_telegram_message
+from modules import youtube_quota, youtube_client, stream_store
+from modules.youtube_manager import BATCH_LIMIT, execute_batch
 
-SCOPES = ['https://www.googleapis.com/auth/youtube.force-ssl']
-CREDENTIALS_PATH = "secrets/credentials.json"
-TOKEN_PATH = "secrets/token.json"
+MAX_LISTED = 40   # Telegram-Nachrichten sind auf 4096 Zeichen begrenzt
 
 def get_authenticated_service():
-    creds = None
-    if os.path.exists(TOKEN_PATH):
-        creds = Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(CREDENTIALS_PATH, SCOPES)
-            creds = flow.run_local_server(port=0, access_type='offline', prompt='consent')
-        with open(TOKEN_PATH, "w") as token:
-            token.write(creds.to_json())
-    return build("youtube", "v3", credentials=creds)
+    service = youtube_client.get_service()
+    if service is None:
+        flow = InstalledAppFlow.from_client_secrets_file(youtube_client.CREDENTIALS_PATH, youtube_client.SCOPES)
+        creds = flow.run_local_server(port=0, access_type='offline', prompt='consent')
+        youtube_client.save_credentials(creds)
+        service = youtube_client.get_service()
+    return service
 
-def delete_old_videos(days_old=10):
-    service = get_authenticated_service()
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days_old)
-    log(f"🧹 Starte Bereinigung: lösche Videos älter als {days_old} Tage (vor {cutoff.date()})")
+def protected_video_ids():
+    """Video-IDs aller Einträge im Stream-Store ab dem aktuellen Monat – diese Videos werden nie gelöscht."""
+    first_of_month = datetime.today().strftime("%Y-%m-01")
+    return {s["broadcast_id"] for s in stream_store.streams_between(first_of_month, "9999-12-31", include_dead=True)
+            if s["broadcast_id"]}
 
-    request = service.search().list(
-        part="id,snippet",
-        forMine=True,
-        type="video",
-        maxResults=50,
-        order="date"
-    )
-    response = request.execute()
+def list_uploads(service):
+    """Alle Uploads des Kanals über die Uploads-Playlist (1 Einheit je 50 Videos statt 100 je Suche)."""
+    response = youtube_quota.execute(service.channels().list(part="contentDetails", mine=True),
+                                     "channels.list", caller="cleanup", priority="low")
+    playlist_id = response["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
 
-    deleted = []
+    uploads = []
+    page_token = None
+    while True:
+        response = youtube_quota.execute(service.playlistItems().list(
+            part="snippet,contentDetails",
+            playlistId=playlist_id,
+            maxResults=50,
+            pageToken=page_token
+        ), "playlistItems.list", caller="cleanup", priority="low")
+        for item in response.get("items", []):
+            published_at = item["contentDetails"].get("videoPublishedAt") or item["snippet"]["publishedAt"]
+            uploads.append({
+                "id": item["contentDetails"]["videoId"],
+                "title": item["snippet"]["title"],
+                "published": datetime.strptime(published_at[:19], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc),
+            })
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+    return uploads
+
+def archived_ids(service, video_ids):
+    """Nur archivierte Videos (keine geplanten oder laufenden) – Status je 50 IDs pro Aufruf."""
+    archived = set()
+    ids = list(video_ids)
+    for i in range(0, len(ids), BATCH_LIMIT):
+        response = youtube_quota.execute(service.videos().list(part="snippet", id=",".join(ids[i:i + BATCH_LIMIT])),
+                                         "videos.list", caller="cleanup", priority="low")
+        for item in response.get("items", []):
+            if item["snippet"].get("liveBroadcastContent") == "none":
+                archived.add(item["id"])
+    return archived
 
-    for item in response.get("items", []):
-        snippet = item["snippet"]
-        if snippet.get("liveBroadcastContent") != "none":
-            continue  # Nur archivierte Videos (keine geplanten oder laufenden)
+def _summary(lines, verb, dry_run=False):
+    """Telegram-Zusammenfassung, höchstens MAX_LISTED Videos aufgelistet."""
+    header = "#Bereinigung YouTube" + (" (Probelauf, nichts gelöscht)" if dry_run else "")
+    if not lines:
+        return f"{header}\n✅ Keine Videos zu löschen."
+    listed = lines[:MAX_LISTED] + ([f"… und {len(lines) - MAX_LISTED} weitere"] if len(lines) > MAX_LISTED else [])
+    return "{}\n🧹 {} Video(s) {}:\n{}".format(header, len(lines), verb, "\n".join(listed))
 
-        video_id = item["id"]["videoId"]
-        published_at = snippet["publishedAt"]
-        published_date = datetime.strptime(published_at, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+def delete_old_videos(days_old=10, dry_run=False):
+    service = get_authenticated_service()
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days_old)
+    log(f"🧹 Starte Bereinigung{' (Probelauf)' if dry_run else ''}: lösche Videos älter als {days_old} Tage (vor {cutoff.date()})")
 
-        if published_date < cutoff:
-            try:
-                service.videos().delete(id=video_id).execute()
-                title = snippet["title"]
-                log(f"🗑️ Gelöscht: {title} ({published_date.date()})")
-                deleted.append(f"• {title} ({published_date.date()})")
-            except Exception as e:
-                log(f"⚠️ Fehler beim Löschen von {video_id}: {e}")
+    try:
+        uploads = list_uploads(service)
+        protected = protected_video_ids()
+        old = [v for v in uploads if v["published"] < cutoff and v["id"] not in protected]
+        archived = archived_ids(service, [v["id"] for v in old]) if old else set()
+    except youtube_quota.QuotaBudgetExceeded as e:
+        log(f"⏸️ {e} – Bereinigung verschoben.")
+        return
+    candidates = [v for v in old if v["id"] in archived]
+    log(f"📋 {len(uploads)} Uploads, {len(candidates)} zu löschen, {len(protected)} durch Monats-XML geschützt.")
 
-    if deleted:
-        msg = "#Bereinigung YouTube\n🧹 {} Video(s) gelöscht:\n{}".format(len(deleted), "\n".join(deleted))
-    else:
-        msg = "#Bereinigung YouTube\n✅ Keine Videos zu löschen."
+    if dry_run:
+        for v in candidates:
+            log(f"🔍 Würde löschen: {v['title']} ({v['published'].date()}, {v['id']})")
+        send_telegram_message(_summary([f"• {v['title']} ({v['published'].date()})" for v in candidates],
+                                       "würden gelöscht", dry_run=True))
+        log("📤 Telegram-Zusammenfassung (Probelauf) gesendet.")
+        return candidates
+
+    deleted = []
+    for i in range(0, len(candidates), BATCH_LIMIT):
+        chunk = candidates[i:i + BATCH_LIMIT]
+        try:
+            youtube_quota.check_budget("videos.delete", "low", count=len(chunk))
+        except youtube_quota.QuotaBudgetExceeded as e:
+            log(f"⏸️ {e} – restliche Löschungen verschoben.")
+            break
+        results = execute_batch(service, [(v["id"], service.videos().delete(id=v["id"]), "videos.delete")
+                                           for v in chunk], caller="cleanup")
+        for v in chunk:
+            _, error = results.get(v["id"], (None, RuntimeError("keine Antwort im Batch")))
+            if error is not None:
+                log(f"⚠️ Fehler beim Löschen von {v['id']}: {error}")
+                continue
+            log(f"🗑️ Gelöscht: {v['title']} ({v['published'].date()})")
+            deleted.append(f"• {v['title']} ({v['published'].date()})")
 
-    send_telegram_message(msg)
+    send_telegram_message(_summary(deleted, "gelöscht"))
     log("📤 Telegram-Zusammenfassung gesendet.")
+    return candidates
 
 if __name__ == "__main__":
-    delete_old_videos(days_old=10)
+    parser = argparse.ArgumentParser(description="Alte YouTube-Videos des Kanals löschen")
+    parser.add_argument("--days", type=int, default=10, help="Videos älter als so viele Tage löschen")
+    parser.add_argument("--dry-run", action="store_true", help="Nur anzeigen, was gelöscht würde")
+    args = parser.parse_args()
+    delete_old_videos(days_old=args.days, dry_run=args.dry_run)